@@ -1,21 +1,80 @@
-import json
+import os
+import re
+import sys
 from datetime import datetime, timedelta
 import argparse
 from pathlib import Path
-from bs4 import BeautifulSoup
+from lxml import etree
 from pytz import UTC 
 import csv
-from typing import Set
+from operator import itemgetter
+from typing import AbstractSet, FrozenSet
+
+try:
+    from .jsonio import dumps_json, ensure_dir, loads_json
+except ImportError:  # run as a script, with scripts/ on sys.path
+    from jsonio import dumps_json, ensure_dir, loads_json
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCOREBOARD_DATA_DIR = REPO_ROOT / "data" / "scoreboard"
 RAW_DATA_DIR = REPO_ROOT / "data" / "raw"
-SCOREBOARD_DATA_DIR.mkdir(parents=True, exist_ok=True)
-RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 DEFAULT_OUTPUT = SCOREBOARD_DATA_DIR / "weekend_fixtures.json"
 DEFAULT_FULL_JSON = SCOREBOARD_DATA_DIR / "full_json_data.json"
 DEFAULT_EXCLUSIONS = SCOREBOARD_DATA_DIR / "exclusions.json"
 
+NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.DOTALL
+)
+AGE_BAND_RE = re.compile(r'u1[68]', re.IGNORECASE)
+CSV_HEADER = ('Team', 'Opponent', 'Match_Time', 'Location', 'Division')
+CSV_BUFFER_SIZE = 1 << 16
+HTML_FEED_CHUNK_SIZE = 1 << 16
+_EMPTY = {}
+
+
+class _NextDataTarget:
+    """lxml parser target that collects the text of <script id="__NEXT_DATA__">."""
+
+    def __init__(self):
+        self._capturing = False
+        self._parts = []
+        self.done = False
+
+    def start(self, tag, attrib):
+        if tag == 'script' and attrib.get('id') == '__NEXT_DATA__':
+            self._capturing = True
+
+    def data(self, text):
+        if self._capturing:
+            self._parts.append(text)
+
+    def end(self, tag):
+        if self._capturing and tag == 'script':
+            self._capturing = False
+            self.done = True
+
+    def close(self):
+        return ''.join(self._parts) if self.done else None
+
+
+def _find_next_data_script(html: bytes):
+    """
+    Return the __NEXT_DATA__ script text from raw HTML bytes, or None.
+
+    The document is fed to lxml in chunks and feeding stops as soon as the
+    script tag closes, so the rest of the page is never tokenized.
+    """
+    if not html:
+        return None
+    target = _NextDataTarget()
+    parser = etree.HTMLParser(target=target, encoding='utf-8')
+    for offset in range(0, len(html), HTML_FEED_CHUNK_SIZE):
+        parser.feed(html[offset:offset + HTML_FEED_CHUNK_SIZE])
+        if target.done:
+            break
+    return parser.close()
+
+
 def extract_json_from_html(html_file):
     """
     Extract JSON data from an HTML file.
@@ -27,19 +86,23 @@ def extract_json_from_html(html_file):
         dict: Parsed JSON data
     """
     try:
-        # Open and read the HTML file
-        with open(html_file, 'r') as file:
-            soup = BeautifulSoup(file, 'html.parser')
+        with open(html_file, 'rb') as file:
+            html = file.read()
+
+        # Fast path: pull the __NEXT_DATA__ payload straight out of the raw bytes
+        match = NEXT_DATA_RE.search(html)
+        if match:
+            return loads_json(match.group(1))
 
-        # Find the <script> tag with the id "__NEXT_DATA__"
-        script_tag = soup.find('script', id='__NEXT_DATA__', type='application/json')
+        # Fall back to an lxml event parse that stops at the end of the script tag
+        script_text = _find_next_data_script(html)
 
-        if not script_tag:
+        if script_text is None:
             print("Error: JSON data not found in HTML")
             return {}
 
         # Parse the JSON data from the script tag's content
-        json_data = json.loads(script_tag.string)
+        json_data = loads_json(script_text)
         return json_data
     except Exception as e:
         print(f"Error reading HTML or extracting JSON: {str(e)}")
@@ -55,19 +118,28 @@ def save_json_to_file(json_data, file_name):
     """
     try:
         path = Path(file_name)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open('w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=4)
+        ensure_dir(path.parent)
+        path.write_bytes(dumps_json(json_data))
         print(f"JSON data saved to {path}")
     except Exception as e:
         print(f"Error saving JSON to file: {str(e)}")
 
-def extract_fixtures(json_data):
+def _parse_score(raw_score):
+    """Safely parse score values coming from the feed (often strings)."""
+    try:
+        return int(raw_score)
+    except (TypeError, ValueError):
+        return None
+
+
+def extract_fixtures(json_data, dump_full_json=None):
     """
     Extract fixture information from the provided JSON data.
     
     Args:
         json_data (dict): Dictionary containing fixture data
+        dump_full_json (bool): Save the full JSON to DEFAULT_FULL_JSON for debugging.
+            Defaults to the DUMP_FULL_JSON environment variable.
     
     Returns:
         list: List of dictionaries containing relevant fixture information
@@ -76,41 +148,50 @@ def extract_fixtures(json_data):
         fixtures = []
         
         # Debug: save the full JSON structure to a file for inspection
-        save_json_to_file(json_data, DEFAULT_FULL_JSON)
+        if dump_full_json is None:
+            dump_full_json = bool(os.environ.get('DUMP_FULL_JSON'))
+        if dump_full_json:
+            save_json_to_file(json_data, DEFAULT_FULL_JSON)
 
         # Access the relevant section of the JSON
-        currently_loaded = json_data.get('props', {}).get('initialReduxState', {}).get('calendar', {}).get('currentlyLoaded', {})
+        try:
+            currently_loaded = json_data['props']['initialReduxState']['calendar']['currentlyLoaded'] or _EMPTY
+        except (KeyError, TypeError):
+            currently_loaded = _EMPTY
 
+        append = fixtures.append
         # Iterate through each key in currentlyLoaded (each fixture identifier)
-        for key, value in currently_loaded.items():
+        for value in currently_loaded.values():
             # For each item in 'days', check if it contains fixtures
-            for day in value.get('days', []):
+            for day in value.get('days', ()):
                 # Extract fixtures if present
-                for fixture in day.get('fixtures', []):
-                    # Safely parse score values coming from the feed (often strings)
-                    def _parse_score(raw_score):
-                        try:
-                            return int(raw_score)
-                        except (TypeError, ValueError):
-                            return None
-
-                    fixture_info = {
-                        'date': fixture.get('dateTime'),
-                        'team': fixture.get('teamName'),
-                        'competition': fixture.get('type'),
-                        'division': fixture.get('division'),
-                        'home_team': fixture.get('homeSide', {}).get('name'),
-                        'away_team': fixture.get('awaySide', {}).get('name'),
-                        'kickoff': fixture.get('kickoff'),
-                        'location': fixture.get('location'),
-                        'ha': fixture.get('ha'),
-                        'competitionId': fixture.get('competitionId'),
-                        'status': 'Cancelled/Postponed' if fixture.get('isCancelledOrPostponed') else 'Scheduled',
-                        'fixtureId': fixture.get('id'),
-                        'home_score': _parse_score(fixture.get('homeSide', {}).get('score')),
-                        'away_score': _parse_score(fixture.get('awaySide', {}).get('score'))
-                    }
-                    fixtures.append(fixture_info)
+                for fixture in day.get('fixtures', ()):
+                    g = fixture.get
+                    home_side = g('homeSide') or _EMPTY
+                    away_side = g('awaySide') or _EMPTY
+                    date_time = g('dateTime')
+                    competition = g('type')
+                    team = g('teamName')
+
+                    append({
+                        'date': date_time,
+                        'team': team,
+                        'competition': competition,
+                        'division': g('division'),
+                        'home_team': home_side.get('name'),
+                        'away_team': away_side.get('name'),
+                        'kickoff': g('kickoff'),
+                        'location': g('location'),
+                        'ha': g('ha'),
+                        'competitionId': g('competitionId'),
+                        'status': 'Cancelled/Postponed' if g('isCancelledOrPostponed') else 'Scheduled',
+                        'fixtureId': g('id'),
+                        'home_score': _parse_score(home_side.get('score')),
+                        'away_score': _parse_score(away_side.get('score')),
+                        '_ts_utc': _parse_timestamp(date_time),
+                        '_category': _json_category_for(competition),
+                        '_csv_category': _csv_category_for(competition, team),
+                    })
 
         return fixtures
     except Exception as e:
@@ -126,14 +207,50 @@ def is_kids_fixture(fixture):
     - division is None
     - either home or away team name contains 'u18' or 'u16' (case-insensitive)
     """
-    division_is_null = fixture.get('division') is None
+    if fixture.get('division') is None:
+        return True
+    return (
+        AGE_BAND_RE.search(fixture.get('home_team') or '') is not None
+        or AGE_BAND_RE.search(fixture.get('away_team') or '') is not None
+    )
+
+
+def _parse_timestamp(date_str):
+    """Return the POSIX timestamp for an ISO datetime string, or None if it is missing/invalid."""
+    try:
+        return datetime.fromisoformat(date_str).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def fixture_timestamp(fixture):
+    """
+    Return the fixture's kickoff as a POSIX timestamp.
 
-    home = (fixture.get('home_team') or '').lower()
-    away = (fixture.get('away_team') or '').lower()
+    Uses the '_ts_utc' value cached by extract_fixtures when present so the
+    ISO string is only parsed once, however many filters run over it.
+    """
+    if '_ts_utc' in fixture:
+        return fixture['_ts_utc']
+    return _parse_timestamp(fixture.get('date'))
 
-    contains_age_band = ('u18' in home) or ('u16' in home) or ('u18' in away) or ('u16' in away)
 
-    return division_is_null or contains_age_band
+def fixtures_in_window(fixtures, start_ts, end_ts):
+    """
+    Return the non-kids, non-TBC fixtures kicking off in [start_ts, end_ts).
+
+    A single pass in input order. The cached timestamp comparison runs first,
+    so the kids/TBC checks are skipped for fixtures outside the window.
+    """
+    result = []
+    for fixture in fixtures:
+        fixture_ts = fixture_timestamp(fixture)
+        if fixture_ts is None or not start_ts <= fixture_ts < end_ts:
+            continue
+        if is_kids_fixture(fixture) or has_tbc_kickoff(fixture):
+            continue
+        result.append(fixture)
+    return result
 
 
 def has_tbc_kickoff(fixture):
@@ -144,7 +261,7 @@ def has_tbc_kickoff(fixture):
     return str(kickoff).strip().lower() == 'tbc'
 
 
-def filter_weekend_fixtures(fixtures):
+def filter_weekend_fixtures(fixtures, now=None):
     """
     Filter fixtures to include only those on Saturday and Sunday of the
     *current* weekend.
@@ -153,9 +270,10 @@ def filter_weekend_fixtures(fixtures):
     - On Saturday: use that same day's Saturday.
     - On Sunday: still use the current weekend (yesterday's Saturday).
     - Monday–Friday: use the upcoming Saturday of this week.
+
+    `now` (an aware datetime) replaces the current time, e.g. in tests.
     """
-    weekend_fixtures = []
-    today = datetime.now(UTC)
+    today = now.astimezone(UTC) if now is not None else datetime.now(UTC)
 
     # Work out the "anchor" Saturday in UTC for the current weekend
     if today.weekday() == 6:  # Sunday
@@ -180,49 +298,34 @@ def filter_weekend_fixtures(fixtures):
 
     print(f"Filtering for fixtures between {range_start} and {range_end}")
 
-    for fixture in fixtures:
-        # Exclude kids fixtures
-        if is_kids_fixture(fixture):
-            continue
-        # Exclude fixtures with TBC kickoff
-        if has_tbc_kickoff(fixture):
-            continue
-        fixture_datetime = datetime.fromisoformat(fixture["date"]).astimezone(UTC)
-        if range_start <= fixture_datetime < range_end:
-            weekend_fixtures.append(fixture)
-
-    return weekend_fixtures
+    # Kids fixtures and fixtures with a TBC kickoff are excluded
+    return fixtures_in_window(fixtures, range_start.timestamp(), range_end.timestamp())
 
-def load_exclusions(exclusions_path: Path = DEFAULT_EXCLUSIONS) -> Set[str]:
+def load_exclusions(exclusions_path: Path = DEFAULT_EXCLUSIONS) -> FrozenSet[str]:
     """Load a set of fixture IDs to exclude from output. Supports either a JSON array of IDs
     or an object with key "fixtureIds": [ ... ]. Missing file -> empty set.
     """
     try:
-        with Path(exclusions_path).open('r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = loads_json(Path(exclusions_path).read_bytes())
         if isinstance(data, list):
-            return {str(x) for x in data}
+            return frozenset(str(x) for x in data)
         if isinstance(data, dict) and 'fixtureIds' in data and isinstance(data['fixtureIds'], list):
-            return {str(x) for x in data['fixtureIds']}
+            return frozenset(str(x) for x in data['fixtureIds'])
     except FileNotFoundError:
-        return set()
+        return frozenset()
     except Exception:
-        return set()
+        return frozenset()
+    return frozenset()
 
-def apply_exclusions(fixtures, excluded_ids: Set[str]):
+def apply_exclusions(fixtures, excluded_ids: AbstractSet[str]):
     """Return fixtures excluding any whose fixtureId is in excluded_ids."""
     if not excluded_ids:
         return fixtures
-    filtered = []
-    for fixture in fixtures:
-        fixture_id = fixture.get('fixtureId')
-        if fixture_id is None:
-            filtered.append(fixture)
-            continue
-        if str(fixture_id) in excluded_ids:
-            continue
-        filtered.append(fixture)
-    return filtered
+    return [
+        fixture for fixture in fixtures
+        if fixture.get('fixtureId') is None or str(fixture['fixtureId']) not in excluded_ids
+    ]
+
 def print_fixtures(fixtures):
     """
     Print fixture information in a readable format.
@@ -233,120 +336,120 @@ def print_fixtures(fixtures):
     if not fixtures:
         print("No fixtures found")
         return
-        
+
+    lines = []
     for fixture in fixtures:
-        print("\n=== Fixture Details ===")
-        print(f"Date: {fixture['date']}")
-        print(f"Team: {fixture['team']}")
-        print(f"Competition: {fixture['competition']}")
-        print(f"Division: {fixture['division']}")
-        print(f"Match: {fixture['home_team']} vs {fixture['away_team']}")
-        print(f"Kickoff: {fixture['kickoff']}")
-        print(f"Location: {fixture['location'] or 'TBC'}")
-        print(f"ha: {fixture['ha']}")
-        print(f"CompetitionID: {fixture['competitionId']}")
-        print(f"Status: {fixture['status']}")
+        lines.append("\n=== Fixture Details ===")
+        lines.append(f"Date: {fixture['date']}")
+        lines.append(f"Team: {fixture['team']}")
+        lines.append(f"Competition: {fixture['competition']}")
+        lines.append(f"Division: {fixture['division']}")
+        lines.append(f"Match: {fixture['home_team']} vs {fixture['away_team']}")
+        lines.append(f"Kickoff: {fixture['kickoff']}")
+        lines.append(f"Location: {fixture['location'] or 'TBC'}")
+        lines.append(f"ha: {fixture['ha']}")
+        lines.append(f"CompetitionID: {fixture['competitionId']}")
+        lines.append(f"Status: {fixture['status']}")
         # Optional score and fixture id
-        if fixture.get('home_score') is not None or fixture.get('away_score') is not None:
-            print(f"Score: {fixture.get('home_score') if fixture.get('home_score') is not None else '-'} - {fixture.get('away_score') if fixture.get('away_score') is not None else '-'}")
+        home_score = fixture.get('home_score')
+        away_score = fixture.get('away_score')
+        if home_score is not None or away_score is not None:
+            lines.append(f"Score: {home_score if home_score is not None else '-'} - {away_score if away_score is not None else '-'}")
         if fixture.get('fixtureId'):
-            print(f"FixtureID: {fixture.get('fixtureId')}")
+            lines.append(f"FixtureID: {fixture.get('fixtureId')}")
 
+    # Write everything in one go rather than one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def process_fixtures(fixtures):
-    # Separate men's and women's fixtures based on competition name
-    mens_fixtures = []
-    womens_fixtures = []
 
-    for fixture in fixtures:
-        competition = fixture['competition'].lower() if fixture['competition'] else ''
+def _csv_category_for(competition, team):
+    """
+    Work out which CSV (men's or women's) a fixture is written to.
 
-        # Check competition name to determine gender
-        if "women" in competition:
-            womens_fixtures.append(fixture)
-        elif "men" in competition:
-            mens_fixtures.append(fixture)
-        else:
-            # If unclear, check team name as fallback
-            team_name = fixture['team']
-            if team_name.startswith("Men's"):
-                mens_fixtures.append(fixture)
-            elif team_name.startswith("Women's"):
-                womens_fixtures.append(fixture)
-            else:
-                # Default to men's if still unclear
-                mens_fixtures.append(fixture)
-
-    # Sort fixtures by team number
-    def get_team_number(fixture):
-        try:
-            return int(''.join(filter(str.isdigit, fixture['team'])))
-        except ValueError:
-            return float('inf')
+    The competition name decides first ("women", then "men"); if it is unclear
+    the team name prefix is used, defaulting to men.
+    """
+    competition = competition.lower() if competition else ''
+    if "women" in competition:
+        return "women"
+    if "men" in competition:
+        return "men"
+    if (team or '').startswith("Women's"):
+        return "women"
+    return "men"
 
-    mens_fixtures.sort(key=get_team_number)
-    womens_fixtures.sort(key=get_team_number)
 
-    # Write to CSV files
-    def write_to_csv(fixtures, filename):
-        path = SCOREBOARD_DATA_DIR / filename
-        with path.open('w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Team', 'Opponent', 'Match_Time', 'Location', 'Division'])
+def _json_category_for(competition):
+    """
+    Work out the JSON "category" of a fixture from its competition name:
+    women for women's/girls' competitions, otherwise men.
 
-            for fixture in fixtures:
-                team_name = fixture['team']
-                opponent = fixture['away_team'] if fixture['ha'] == 'h' else fixture['home_team']
-                location = 'Home' if fixture['ha'] == 'h' else 'Away'
-                division = 'Friendly' if fixture['competitionId'] == 'f' else fixture['division']
+    Unlike the CSV split this also knows girls/boys competitions and ignores
+    the team name.
+    """
+    competition = competition.lower() if competition else ''
+    if "women" in competition or "girls" in competition:
+        return "women"
+    return "men"
 
-                writer.writerow([
-                    team_name,
-                    opponent,
-                    fixture['kickoff'],
-                    location,
-                    division
-                ])
 
-    write_to_csv(mens_fixtures, 'mens_fixtures.csv')
-    write_to_csv(womens_fixtures, 'womens_fixtures.csv')
-    print(f"Created mens_fixtures.csv with {len(mens_fixtures)} fixtures")
-    print(f"Created womens_fixtures.csv with {len(womens_fixtures)} fixtures")
+def csv_category(fixture):
+    """Return the fixture's CSV category, using the value cached by extract_fixtures when present."""
+    if '_csv_category' in fixture:
+        return fixture['_csv_category']
+    return _csv_category_for(fixture.get('competition'), fixture.get('team'))
 
 
-    def get_team_number(fixture):
-        try:
-            return int(''.join(filter(str.isdigit, fixture['team'])))
-        except ValueError:
-            return float('inf')
+def fixture_category(fixture):
+    """Return the fixture's JSON category, using the value cached by extract_fixtures when present."""
+    if '_category' in fixture:
+        return fixture['_category']
+    return _json_category_for(fixture.get('competition'))
 
-    mens_fixtures.sort(key=get_team_number)
-    womens_fixtures.sort(key=get_team_number)
+
+def get_team_number(fixture):
+    """
+    Sort key: all the digits in the team name read as one number (e.g. 2 for
+    "Men's 2s", 114 for "St Albans 1 (U14)"), or inf if there are none.
+    """
+    try:
+        return int(''.join(filter(str.isdigit, fixture['team'] or '')))
+    except ValueError:
+        return float('inf')
 
 
-def generate_json_output(fixtures, output_filename: Path = DEFAULT_OUTPUT):
+def build_outputs(fixtures):
     """
-    Generate JSON output with fixtures separated into home and away categories.
+    Walk the selected fixtures once and build everything the writers need.
 
     Args:
         fixtures (list): List of fixture dictionaries
-        output_filename (str): Name of the JSON file to create
+
+    Returns:
+        dict: 'mens'/'womens' CSV rows sorted by team number, and
+        'home'/'away' fixture objects for the JSON output
     """
+    mens_rows = []
+    womens_rows = []
     home_fixtures = []
     away_fixtures = []
 
     for fixture in fixtures:
-        competition = fixture['competition'].lower() if fixture['competition'] else ''
-
-        # Determine category (men/women)
-        if "women" in competition or "girls" in competition:
-            category = "women"
-        elif "men" in competition or "boys" in competition:
-            category = "men"
-        else:
-            category = "men"  # default
+        is_home = fixture['ha'] == 'h'
+        category = fixture_category(fixture)
+        location = "Home" if is_home else "Away"
+
+        csv_row = (
+            fixture['team'],
+            fixture['away_team'] if is_home else fixture['home_team'],
+            fixture['kickoff'],
+            location,
+            'Friendly' if fixture['competitionId'] == 'f' else fixture['division'],
+        )
+        (womens_rows if csv_category(fixture) == "women" else mens_rows).append(
+            (get_team_number(fixture), csv_row)
+        )
 
-        # Create fixture object
         fixture_obj = {
             "date": fixture['date'],
             "team": fixture['team'],
@@ -354,19 +457,67 @@ def generate_json_output(fixtures, output_filename: Path = DEFAULT_OUTPUT):
             "home_team": fixture['home_team'],
             "away_team": fixture['away_team'],
             "kickoff": fixture['kickoff'],
-            "division": fixture['division'] if fixture['division'] else "Friendly",
-            "location": "Home" if fixture['ha'] == 'h' else "Away",
+            "division": fixture['division'] or "Friendly",
+            "location": location,
             "status": fixture['status'],
             "fixtureId": fixture.get('fixtureId'),
             "home_score": fixture.get('home_score'),
             "away_score": fixture.get('away_score')
         }
+        (home_fixtures if is_home else away_fixtures).append(fixture_obj)
 
-        # Add to home or away list
-        if fixture['ha'] == 'h':
-            home_fixtures.append(fixture_obj)
-        else:
-            away_fixtures.append(fixture_obj)
+    # Sort CSV rows by team number (stable, so feed order breaks ties)
+    mens_rows.sort(key=itemgetter(0))
+    womens_rows.sort(key=itemgetter(0))
+
+    return {
+        "mens": [row for _, row in mens_rows],
+        "womens": [row for _, row in womens_rows],
+        "home": home_fixtures,
+        "away": away_fixtures,
+    }
+
+
+def process_fixtures(fixtures, outputs=None):
+    """
+    Write men's and women's CSV files, sorted by team number.
+
+    Args:
+        fixtures (list): List of fixture dictionaries
+        outputs (dict): Pre-built result of build_outputs(fixtures), if available
+    """
+    if outputs is None:
+        outputs = build_outputs(fixtures)
+
+    # Write to CSV files
+    ensure_dir(SCOREBOARD_DATA_DIR)
+
+    def write_to_csv(rows, filename):
+        path = SCOREBOARD_DATA_DIR / filename
+        with path.open('w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(rows)
+
+    write_to_csv(outputs["mens"], 'mens_fixtures.csv')
+    write_to_csv(outputs["womens"], 'womens_fixtures.csv')
+    print(f"Created mens_fixtures.csv with {len(outputs['mens'])} fixtures")
+    print(f"Created womens_fixtures.csv with {len(outputs['womens'])} fixtures")
+
+
+def generate_json_output(fixtures, output_filename: Path = DEFAULT_OUTPUT, outputs=None):
+    """
+    Generate JSON output with fixtures separated into home and away categories.
+
+    Args:
+        fixtures (list): List of fixture dictionaries
+        output_filename (str): Name of the JSON file to create
+        outputs (dict): Pre-built result of build_outputs(fixtures), if available
+    """
+    if outputs is None:
+        outputs = build_outputs(fixtures)
+    home_fixtures = outputs["home"]
+    away_fixtures = outputs["away"]
 
     # Create final JSON structure
     output = {
@@ -377,9 +528,8 @@ def generate_json_output(fixtures, output_filename: Path = DEFAULT_OUTPUT):
 
     # Write to file
     output_path = Path(output_filename)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open('w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    ensure_dir(output_path.parent)
+    output_path.write_bytes(dumps_json(output))
 
     print(f"Created {output_path} with {len(home_fixtures)} home and {len(away_fixtures)} away fixtures")
 
@@ -402,34 +552,27 @@ def filter_by_date_range(fixtures, start_date_str, end_date_str):
 
     print(f"Filtering for fixtures between {range_start} and {range_end} (by date range)")
 
-    filtered = []
-    for fixture in fixtures:
-        # Exclude kids fixtures
-        if is_kids_fixture(fixture):
-            continue
-        # Exclude fixtures with TBC kickoff
-        if has_tbc_kickoff(fixture):
-            continue
-        try:
-            fixture_datetime = datetime.fromisoformat(fixture['date']).astimezone(UTC)
-        except Exception:
-            continue
-        if range_start <= fixture_datetime < range_end:
-            filtered.append(fixture)
-    return filtered
+    # Kids fixtures and fixtures with a TBC kickoff are excluded
+    return fixtures_in_window(fixtures, range_start.timestamp(), range_end.timestamp())
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Extract and filter fixtures (weekend or date range)")
     parser.add_argument("--start", type=str, help="Start date dd/mm/YYYY", required=False)
     parser.add_argument("--end", type=str, help="End date dd/mm/YYYY", required=False)
     parser.add_argument("--output", type=str, help="Output JSON filename", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--dump-full-json", action="store_true", help=f"Also save the raw page JSON to {DEFAULT_FULL_JSON}")
     args = parser.parse_args()
 
-    # Find the most recent matches_data file
-    matches_files = sorted(RAW_DATA_DIR.glob('matches_data_*.html'), key=lambda p: p.stat().st_mtime)
+    # Find the most recent matches_data file (DirEntry.stat() results are cached by scandir)
+    ensure_dir(RAW_DATA_DIR)
+    with os.scandir(RAW_DATA_DIR) as entries:
+        matches_files = [
+            entry for entry in entries
+            if entry.name.startswith('matches_data_') and entry.name.endswith('.html')
+        ]
 
     if matches_files:
-        html_file = matches_files[-1]
+        html_file = Path(max(matches_files, key=lambda entry: entry.stat().st_mtime).path)
     else:
         html_file = RAW_DATA_DIR / 'matches_data.html'
 
@@ -440,7 +583,7 @@ if __name__ == "__main__":
 
     # If valid JSON data is extracted, process and print fixtures
     if json_data:
-        fixtures = extract_fixtures(json_data)
+        fixtures = extract_fixtures(json_data, dump_full_json=args.dump_full_json or None)
         if args.start and args.end:
             selected = filter_by_date_range(fixtures, args.start, args.end)
         else:
@@ -450,5 +593,6 @@ if __name__ == "__main__":
         if excluded_ids:
             selected = apply_exclusions(selected, excluded_ids)
         print_fixtures(selected)
-        process_fixtures(selected)
-        generate_json_output(selected, output_filename=Path(args.output))
\ No newline at end of file
+        outputs = build_outputs(selected)
+        process_fixtures(selected, outputs=outputs)
+        generate_json_output(selected, output_filename=Path(args.output), outputs=outputs)
\ No newline at end of file
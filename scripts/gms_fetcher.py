@@ -25,28 +25,73 @@ python gms_fetcher.py recent-results --team-id <uuid> --comp-id <uuid> --weekend
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import io
 import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from html import unescape as html_unescape
 from html.parser import HTMLParser
 from pathlib import Path
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 import csv
-import csv
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # pragma: no cover - lxml is optional
+    lxml_html = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    from .jsonio import dumps_json, ensure_dir, loads_json
+except ImportError:  # run as a script, with scripts/ on sys.path
+    from jsonio import dumps_json, ensure_dir, loads_json
 
 GMS_REFRESH_BASE = "https://gmsfeed.co.uk/api/show/refresh"
 GMS_COMPETITIONS_URL = "https://gmsfeed.co.uk/api/competitions?team={team_id}"
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CONFIG_DIR = REPO_ROOT / "config"
 LEAGUE_DATA_DIR = REPO_ROOT / "data" / "league"
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-LEAGUE_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def print_json(payload, encoded: Optional[bytes] = None) -> None:
+    """
+    Pretty-print payload to stdout, handing orjson's bytes straight to the
+    buffer when possible. `encoded` may carry dumps_json(payload) from an
+    earlier save_json so the payload is not serialized twice.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json.dumps(payload, indent=2))
+        return
+    if encoded is None:
+        encoded = dumps_json(payload)
+    sys.stdout.flush()
+    buffer.write(encoded + b"\n")
+    buffer.flush()
+
+
+@functools.lru_cache(maxsize=128)
 def resolve_repo_path(path: Path) -> Path:
     """
     Resolve a provided path relative to the repository root if it is not
@@ -57,17 +102,25 @@ def resolve_repo_path(path: Path) -> Path:
     return path if path.is_absolute() else REPO_ROOT / path
 
 
+# Gender prefixes GMS puts on competition labels, and the season suffix
+# stripped from scoreboard division names. Update SEASON_SUFFIX each season.
+COMP_LABEL_PREFIXES = ("East Open - Men's ", "East Women's ")
+SEASON_SUFFIX = " (2025-2026)"
+
+
 def normalize_comp_label(label: Optional[str]) -> Optional[str]:
     """Strip leading gender prefixes from competition labels for cleaner display."""
     if not label:
         return label
-    prefixes = ["East Open - Men's ", "East Women's "]
-    for prefix in prefixes:
+    for prefix in COMP_LABEL_PREFIXES:
         if label.startswith(prefix):
             return label[len(prefix) :]
     return label
 
-def build_show_url(show: str, team_id: str, comp_id: Optional[str] = None, **extra) -> str:
+@functools.lru_cache(maxsize=512)
+def _build_show_url(
+    show: str, team_id: str, comp_id: Optional[str], extra: Tuple[Tuple[str, Any], ...]
+) -> str:
     params = {
         "method": "api",
         "show": show,
@@ -76,15 +129,34 @@ def build_show_url(show: str, team_id: str, comp_id: Optional[str] = None, **ext
     }
     if comp_id:
         params["comp_id"] = comp_id.strip()
-    params.update({k: v for k, v in extra.items() if v is not None})
+    params.update(extra)
     return f"{GMS_REFRESH_BASE}?{urlencode(params)}"
 
+
+def build_show_url(show: str, team_id: str, comp_id: Optional[str] = None, **extra) -> str:
+    # The same team/competition URLs are rebuilt on every retry and rerun, so
+    # the encoded string is memoized; extras keep their keyword order
+    return _build_show_url(
+        show, team_id, comp_id, tuple((k, v) for k, v in extra.items() if v is not None)
+    )
+
 DEFAULT_TEAM_FILE = CONFIG_DIR / "teamIDs.json"
 DEFAULT_COMP_OUTPUT = CONFIG_DIR / "teamCompIDs.json"
 DEFAULT_TEAM_DATA_OUTPUT = LEAGUE_DATA_DIR / "teamData.json"
 DEFAULT_TEAM_DATA_PREVIOUS = LEAGUE_DATA_DIR / "teamData.prev.json"
+DEFAULT_HTTP_CACHE = CONFIG_DIR / "http_cache.sqlite"
 VALIDATION_MAX_RETRIES = 2
 VALIDATION_BACKOFF_SECONDS = 4
+FETCH_WORKERS = 8
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
+HTTP_TRANSIENT_RETRIES = 3
+RETRY_BACKOFF_CAP_MS = 60_000
+DEFAULT_HEADERS = {
+    "User-Agent": "sahc-scoreboard/1.0",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
 
 
 def qualified_snapshot_path(base: Path, qualifier: str) -> Path:
@@ -92,37 +164,58 @@ def qualified_snapshot_path(base: Path, qualifier: str) -> Path:
     return base.with_name(f"{base.stem}.{qualifier}{base.suffix}")
 
 
+FOOTNOTE_TAGS = frozenset({"div", "p", "span"})
+
+
+def get_attr(attrs: Sequence[Tuple[str, Optional[str]]], name: str, default=None):
+    """Look up one attribute from HTMLParser's attrs list without building a dict."""
+    value = default
+    for key, attr_value in attrs:
+        if key == name:
+            value = attr_value
+    return value
+
+
+def has_class(class_attr: Optional[str], class_name: str) -> bool:
+    """True if class_name is one of the whitespace-separated classes."""
+    # The substring test rejects most tags before any list is allocated
+    return bool(class_attr) and class_name in class_attr and class_name in class_attr.split()
+
+
 class CompetitionHTMLParser(HTMLParser):
     """Extracts competition options from the GMS competitions dropdown HTML."""
 
+    __slots__ = ("_in_select", "_current_option", "_label_chunks", "options")
+
     def __init__(self) -> None:
         super().__init__()
         self._in_select = False
         self._current_option: Optional[Dict[str, str]] = None
+        self._label_chunks: List[str] = []
         self.options: List[Dict[str, str]] = []
 
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if tag == "select" and attrs_dict.get("name") == "comp_id":
+        if tag == "select" and get_attr(attrs, "name") == "comp_id":
             self._in_select = True
         elif self._in_select and tag == "option":
-            value = (attrs_dict.get("value") or "").strip()
+            value = (get_attr(attrs, "value") or "").strip()
             if value:
                 self._current_option = {
                     "compId": value,
                     "label": "",
-                    "selected": "selected" in attrs_dict or attrs_dict.get("selected") is not None,
+                    "selected": any(key == "selected" for key, _ in attrs),
                 }
+                self._label_chunks = []
 
     def handle_data(self, data):
         if self._current_option is not None:
-            self._current_option["label"] += data
+            self._label_chunks.append(data)
 
     def handle_endtag(self, tag):
         if tag == "select" and self._in_select:
             self._in_select = False
         elif tag == "option" and self._current_option is not None:
-            self._current_option["label"] = self._current_option["label"].strip()
+            self._current_option["label"] = "".join(self._label_chunks).strip()
             self.options.append(self._current_option)
             self._current_option = None
 
@@ -130,64 +223,155 @@ class CompetitionHTMLParser(HTMLParser):
 class LeagueRowParser(HTMLParser):
     """Parses the league table HTML chunk to extract stats for a single team."""
 
+    __slots__ = (
+        "target_team",
+        "in_target_row",
+        "in_cell",
+        "cell_chunks",
+        "cells",
+        "capture_league_name",
+        "league_name_chunks",
+    )
+
     def __init__(self, team_id: str) -> None:
         super().__init__()
         self.target_team = team_id.lower()
         self.in_target_row = False
         self.in_cell = False
-        self.current_cell_text = ""
+        self.cell_chunks: List[str] = []
         self.cells: List[str] = []
         self.league_name_chunks: List[str] = []
         self.capture_league_name = False
 
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
         if tag == "tr":
-            classes = (attrs_dict.get("class") or "").split()
-            data_team = (attrs_dict.get("data-team") or "").lower()
+            class_attr = None
+            data_team = None
+            for key, value in attrs:
+                if key == "class":
+                    class_attr = value
+                elif key == "data-team":
+                    data_team = value
             self.in_target_row = (
-                "gms-clubteam" in classes and data_team == self.target_team
+                has_class(class_attr, "gms-clubteam")
+                and (data_team or "").lower() == self.target_team
             )
             if self.in_target_row:
                 self.cells.clear()
 
         if self.in_target_row and tag == "td":
             self.in_cell = True
-            self.current_cell_text = ""
+            self.cell_chunks = []
 
-        if tag in {"div", "p", "span"}:
-            classes = (attrs_dict.get("class") or "").split()
-            if "gms-footnote" in classes:
-                self.capture_league_name = True
+        if tag in FOOTNOTE_TAGS and has_class(get_attr(attrs, "class"), "gms-footnote"):
+            self.capture_league_name = True
 
     def handle_data(self, data):
         if self.in_cell:
-            self.current_cell_text += data
+            self.cell_chunks.append(data)
         if self.capture_league_name:
             self.league_name_chunks.append(data)
 
     def handle_endtag(self, tag):
         if tag == "td" and self.in_cell:
-            self.cells.append(self.current_cell_text.strip())
+            self.cells.append("".join(self.cell_chunks).strip())
             self.in_cell = False
         if tag == "tr" and self.in_target_row:
             self.in_target_row = False
-        if tag in {"div", "p", "span"} and self.capture_league_name:
+        if tag in FOOTNOTE_TAGS and self.capture_league_name:
             self.capture_league_name = False
 
 
+def _class_xpath(tags: str, class_name: str) -> str:
+    return (
+        f"//*[{tags}][contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    )
+
+
+CLUBTEAM_ROW_XPATH = _class_xpath("self::tr", "gms-clubteam")
+FOOTNOTE_XPATH = _class_xpath("self::div or self::p or self::span", "gms-footnote")
+RESULTS_ROW_XPATH = _class_xpath("self::table", "gms-table-results") + "/tbody/tr"
+
+
+def _parse_html_tree(html: str):
+    """Parse a GMS HTML fragment with lxml, or return None to use HTMLParser."""
+    if lxml_html is None or not html:
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def narrow_league_html(html: str, team_id: str) -> Optional[str]:
+    """
+    Cut a league table page down to the team's <tr> plus everything from the
+    first gms-footnote onwards, so the parser skips the other rows. Returns
+    None when the row cannot be located by plain string search.
+    """
+    if not html or not html.isascii():
+        # lower() keeps offsets aligned only for ASCII text
+        return None
+    lowered = html.lower()
+    marker = lowered.find(f'data-team="{team_id.lower()}"')
+    if marker == -1:
+        return None
+    row_start = lowered.rfind("<tr", 0, marker)
+    row_end = lowered.find("</tr>", marker)
+    if row_start == -1 or row_end == -1:
+        return None
+
+    parts = ["<table>", html[row_start : row_end + len("</tr>")], "</table>"]
+    footnote = lowered.find("gms-footnote")
+    if footnote != -1:
+        parts.append(html[lowered.rfind("<", 0, footnote) :])
+    return "".join(parts)
+
+
+def _extract_league_row(html: str, team_id: str) -> Tuple[List[str], List[str]]:
+    tree = _parse_html_tree(html)
+    if tree is None:
+        parser = LeagueRowParser(team_id)
+        parser.feed(html or "")
+        return parser.cells, parser.league_name_chunks
+
+    target_team = team_id.lower()
+    cells: List[str] = []
+    for row in tree.xpath(CLUBTEAM_ROW_XPATH):
+        if (row.get("data-team") or "").lower() == target_team:
+            cells = [td.text_content().strip() for td in row.iter("td")]
+    footnotes = [node.text_content() for node in tree.xpath(FOOTNOTE_XPATH)]
+    return cells, footnotes
+
+
+def extract_league_row(html: str, team_id: str) -> Tuple[List[str], List[str]]:
+    """
+    Return (cells, footnote_chunks) for the team's league table row.
+
+    The page is first narrowed to the team's row and the footnote. lxml then
+    tokenizes it in C and XPath picks out the row directly. Without lxml, or
+    if lxml cannot parse the fragment, LeagueRowParser walks it instead. If
+    the narrowed fragment yields no row, the whole page is parsed.
+    """
+    narrowed = narrow_league_html(html, team_id)
+    if narrowed is not None:
+        cells, footnotes = _extract_league_row(narrowed, team_id)
+        if cells:
+            return cells, footnotes
+    return _extract_league_row(html, team_id)
+
+
 def parse_league_table(html: str, team_id: str) -> Optional[Dict[str, str]]:
-    parser = LeagueRowParser(team_id)
-    parser.feed(html or "")
-    if not parser.cells:
+    cells, league_name_chunks = extract_league_row(html, team_id)
+    if not cells:
         return None
 
     def safe_get(index: int, default: str = "") -> str:
-        return parser.cells[index] if index < len(parser.cells) else default
+        return cells[index] if index < len(cells) else default
 
     league_name = "Unknown League"
-    if parser.league_name_chunks:
-        footnote_text = "".join(parser.league_name_chunks)
+    if league_name_chunks:
+        footnote_text = "".join(league_name_chunks)
         league_name = footnote_text.strip() or league_name
 
     return {
@@ -205,19 +389,72 @@ def parse_league_table(html: str, team_id: str) -> Optional[Dict[str, str]]:
     }
 
 
+COMP_SELECT_RE = re.compile(
+    r"""<select\b[^>]*\bname=["']?comp_id["']?[^>]*>(.*?)</select>""", re.I | re.S
+)
+COMP_OPTION_RE = re.compile(r'<option\s+value="([^"]*)"([^>]*)>([^<]*)</option>', re.I)
+# One attribute per match, name in group 1, so quoted values (class="selected")
+# and other names (data-selected) are skipped
+OPTION_ATTR_RE = re.compile(r"""([^\s=/"']+)(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?""")
+
+
+def _has_selected_attr(attrs: str) -> bool:
+    return any(match.group(1).lower() == "selected" for match in OPTION_ATTR_RE.finditer(attrs))
+
+
 def parse_competitions(html: str) -> List[Dict[str, str]]:
+    """
+    Read the comp_id dropdown options. The GMS markup is regular enough for a
+    regex; if any <option> does not fit the simple pattern, the
+    CompetitionHTMLParser fallback handles the whole fragment.
+    """
+    select = COMP_SELECT_RE.search(html or "")
+    if select:
+        body = select.group(1)
+        matches = list(COMP_OPTION_RE.finditer(body))
+        if len(matches) == body.lower().count("<option"):
+            options = []
+            for match in matches:
+                value = html_unescape(match.group(1)).strip()
+                if value:
+                    options.append(
+                        {
+                            "compId": value,
+                            "label": html_unescape(match.group(3)).strip(),
+                            "selected": _has_selected_attr(match.group(2)),
+                        }
+                    )
+            return options
+
     parser = CompetitionHTMLParser()
     parser.feed(html or "")
     return parser.options
 
 
+class _TargetRowDone(Exception):
+    """Raised from TeamSummaryParser to stop feeding once the team's row is read."""
+
+
 class TeamSummaryParser(HTMLParser):
+    __slots__ = (
+        "target_team",
+        "in_target_row",
+        "in_cell",
+        "text_chunks",
+        "cells",
+        "row_cells",
+        "form_entries",
+        "current_forms",
+        "in_form_span",
+        "form_span_class",
+    )
+
     def __init__(self, team_id: str) -> None:
         super().__init__()
         self.target_team = team_id.lower()
         self.in_target_row = False
         self.in_cell = False
-        self.current_text = ""
+        self.text_chunks: List[str] = []
         self.cells: List[Dict[str, Optional[str]]] = []
         self.row_cells: List[Dict[str, Optional[str]]] = []
         self.form_entries: List[Dict[str, str]] = []
@@ -226,25 +463,31 @@ class TeamSummaryParser(HTMLParser):
         self.form_span_class = ""
 
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
         if tag == "tr":
-            data_team = (attrs_dict.get("data-team") or "").lower()
-            self.in_target_row = data_team == self.target_team or (self.target_team == "" and "data-team" not in attrs_dict)
+            has_data_team = False
+            data_team = None
+            for key, value in attrs:
+                if key == "data-team":
+                    has_data_team = True
+                    data_team = value
+            self.in_target_row = (data_team or "").lower() == self.target_team or (
+                self.target_team == "" and not has_data_team
+            )
             if self.in_target_row:
                 self.row_cells = []
         elif tag == "td" and self.in_target_row:
             self.in_cell = True
-            self.current_text = ""
+            self.text_chunks = []
             self.current_forms = []
         elif tag == "span" and self.in_cell:
-            classes = (attrs_dict.get("class") or "").split()
-            if "gms-form" in classes:
+            class_attr = get_attr(attrs, "class")
+            if has_class(class_attr, "gms-form"):
                 self.in_form_span = True
-                self.form_span_class = " ".join(classes)
+                self.form_span_class = " ".join(class_attr.split())
 
     def handle_data(self, data):
         if self.in_cell:
-            self.current_text += data
+            self.text_chunks.append(data)
         if self.in_form_span:
             result = data.strip()
             if result:
@@ -255,7 +498,7 @@ class TeamSummaryParser(HTMLParser):
             self.in_form_span = False
             self.form_span_class = ""
         elif tag == "td" and self.in_cell:
-            cell_data = {"text": self.current_text.strip()}
+            cell_data = {"text": "".join(self.text_chunks).strip()}
             if self.current_forms:
                 cell_data["forms"] = list(self.current_forms)
                 self.form_entries = list(self.current_forms)
@@ -264,16 +507,67 @@ class TeamSummaryParser(HTMLParser):
         elif tag == "tr" and self.in_target_row:
             self.cells = self.row_cells
             self.in_target_row = False
+            if self.target_team:
+                # A team has a single row, so the rest of the table is not needed
+                raise _TargetRowDone
+
+
+def _extract_team_summary(html: str, team_id: str) -> Tuple[List[str], List[Dict[str, str]]]:
+    """
+    Return (cell_texts, form_entries) for the team's summary row, using lxml
+    when it is available and TeamSummaryParser otherwise. Both stop at the
+    first row for the team (matching narrow_league_html); with an empty
+    team_id every row without data-team matches and the last one wins.
+    """
+    tree = _parse_html_tree(html)
+    if tree is None:
+        parser = TeamSummaryParser(team_id)
+        try:
+            parser.feed(html or "")
+        except _TargetRowDone:
+            pass
+        return [cell.get("text", "") for cell in parser.cells], parser.form_entries
+
+    target_team = team_id.lower()
+    cells: List[str] = []
+    form_entries: List[Dict[str, str]] = []
+    for row in tree.iter("tr"):
+        data_team = row.get("data-team")
+        if (data_team or "").lower() != target_team and not (
+            target_team == "" and data_team is None
+        ):
+            continue
+        cells = []
+        for td in row.iter("td"):
+            cells.append(td.text_content().strip())
+            forms = [
+                {"result": result}
+                for span in td.iter("span")
+                if has_class(span.get("class"), "gms-form")
+                for result in (chunk.strip() for chunk in span.itertext())
+                if result
+            ]
+            if forms:
+                form_entries = forms
+        if target_team:
+            break
+    return cells, form_entries
 
 
 def parse_team_summary(html: str, team_id: str) -> Optional[Dict[str, Optional[str]]]:
-    parser = TeamSummaryParser(team_id)
-    parser.feed(html or "")
-    if not parser.cells:
+    # Only the team's own row is read, so parse just that row when it can be
+    # found by string search and fall back to the whole table otherwise
+    cells: List[str] = []
+    narrowed = narrow_league_html(html, team_id) if team_id else None
+    if narrowed is not None:
+        cells, form_entries = _extract_team_summary(narrowed, team_id)
+    if not cells:
+        cells, form_entries = _extract_team_summary(html, team_id)
+    if not cells:
         return None
 
     def cell_text(index: int) -> str:
-        return parser.cells[index].get("text", "") if index < len(parser.cells) else ""
+        return cells[index] if index < len(cells) else ""
 
     return {
         "teamName": cell_text(0),
@@ -286,7 +580,7 @@ def parse_team_summary(html: str, team_id: str) -> Optional[Dict[str, Optional[s
         "goalDiff": cell_text(7),
         "points": cell_text(8),
         "ppg": cell_text(9),
-        "form": parser.form_entries,
+        "form": form_entries,
     }
 
 
@@ -299,11 +593,20 @@ def select_competition(options: Sequence[Dict[str, str]]) -> Optional[Dict[str,
     return options[0]
 
 
-def save_json(payload, path: Path):
+def save_json(payload, path: Path) -> bytes:
+    """Write payload as indented JSON and return the encoded bytes."""
+    # Write to a sibling temp file and swap it in, so an interrupted run never
+    # leaves a truncated snapshot behind for the next run's fallback lookup
     path = Path(path)
-    if path.parent and not path.parent.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    ensure_dir(path.parent)
+    encoded = dumps_json(payload)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(encoded)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    return encoded
 
 
 def rotate_snapshots(
@@ -316,11 +619,13 @@ def rotate_snapshots(
     if not new_snapshot.exists():
         raise FileNotFoundError(f"New snapshot {new_snapshot} does not exist.")
 
-    if current_snapshot.exists():
-        previous_snapshot.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(previous_snapshot.parent)
+    try:
         current_snapshot.replace(previous_snapshot)
+    except FileNotFoundError:
+        pass  # first run: nothing to archive yet
 
-    current_snapshot.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(current_snapshot.parent)
     new_snapshot.replace(current_snapshot)
 
 
@@ -387,8 +692,45 @@ def fetch_team_record(client: GMSClient, entry: Dict[str, str], index: int):
         return False, f"{name}: {exc}"
 
 
-def deep_copy_record(record: Dict) -> Dict:
-    return json.loads(json.dumps(record))
+def map_concurrently(
+    func: Callable[[Any], Any], items: Iterable[Any], workers: int = FETCH_WORKERS
+) -> List[Any]:
+    """
+    Apply func to every item on up to `workers` threads and return the
+    results in input order. With one worker (or one item) it runs inline.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        # Nothing to overlap, so skip spinning up a pool
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def fetch_team_records(
+    client: GMSClient,
+    jobs: Sequence[Tuple[str, Dict[str, str], int]],
+    workers: int = FETCH_WORKERS,
+) -> Dict[str, Tuple[bool, Any]]:
+    """
+    Fetch every (key, entry, index) job on a thread pool of `workers` threads
+    and return key -> (success, payload). The client's rate limiter still
+    spaces the individual requests; callers walk `jobs` to keep config order.
+    """
+    outcomes = map_concurrently(
+        lambda job: fetch_team_record(client, job[1], job[2]), jobs, workers
+    )
+    return {job[0]: outcome for job, outcome in zip(jobs, outcomes)}
+
+
+def copy_record_with_meta(record: Dict) -> Dict:
+    """
+    Copy a record whose only later mutation is to its "meta" dict: the top
+    level and meta are copied, nested stats/form values are shared.
+    """
+    copied = dict(record)
+    copied["meta"] = dict(record.get("meta") or {})
+    return copied
 
 
 def attach_snapshot_meta(record: Dict, snapshot_date: Optional[str]):
@@ -397,44 +739,68 @@ def attach_snapshot_meta(record: Dict, snapshot_date: Optional[str]):
         record["meta"]["snapshotDate"] = snapshot_date
 
 
-def load_fallback_map(path: Path) -> Dict[str, Dict]:
-    if not Path(path).exists():
-        return {}
+def index_by_team(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map teamId -> record (last one wins), skipping records without a teamId."""
+    return {record["teamId"]: record for record in records if record.get("teamId")}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_fallback_map_cached(path_str: str, mtime_ns: int, size: int) -> Mapping[str, Dict]:
     try:
-        with Path(path).open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = loads_json(Path(path_str).read_bytes())
     except Exception:
-        return {}
-    fallback = {}
-    for item in data:
-        team_id = item.get("teamId")
-        if team_id:
-            fallback[team_id] = item
-    return fallback
+        return MappingProxyType({})
+    return MappingProxyType(index_by_team(data))
+
+
+def load_fallback_map(path: Path) -> Mapping[str, Dict]:
+    """
+    Read-only teamId -> record map for a snapshot, cached per (path, mtime,
+    size) so repeated loads in one process skip the read and decode.
+    """
+    # A missing file is just another unreadable snapshot: no fallbacks
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return MappingProxyType({})
+    return _load_fallback_map_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def read_snapshot(path: Path) -> List[Dict[str, Any]]:
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Snapshot not found: {path}")
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Snapshot not found: {path}") from None
+    data = loads_json(raw)
     if not isinstance(data, list):
         raise ValueError(f"Snapshot {path} must contain a list of team records.")
     return data
 
 
-def analyze_snapshot(records: List[Dict[str, Any]]) -> Dict[str, Any]:
-    team_ids = [record.get("teamId") for record in records if record.get("teamId")]
-    error_entries = [record for record in records if record.get("error")]
-    missing_ppg = [
-        record
-        for record in records
-        if not (record.get("stats") or {}).get("ppg") and not record.get("error")
-    ]
+def analyze_snapshot(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold snapshot records into counts and problem lists in one pass. Only the
+    problem records are kept, so callers need not hold on to the full list.
+    """
+    count = 0
+    team_ids = set()
+    error_entries = []
+    missing_ppg = []
+    for record in records:
+        count += 1
+        team_id = record.get("teamId")
+        if team_id:
+            team_ids.add(team_id)
+        if record.get("error"):
+            error_entries.append(record)
+            continue
+        stats = record.get("stats") or {}
+        if not stats.get("ppg"):
+            missing_ppg.append(record)
     return {
-        "count": len(records),
-        "team_ids": set(team_ids),
+        "count": count,
+        "team_ids": team_ids,
         "errors": error_entries,
         "missing_ppg": missing_ppg,
     }
@@ -443,8 +809,7 @@ def analyze_snapshot(records: List[Dict[str, Any]]) -> Dict[str, Any]:
 def command_validate_snapshots(
     current_path: Path, previous_path: Optional[Path], expected_count: Optional[int]
 ):
-    current_records = read_snapshot(current_path)
-    current_stats = analyze_snapshot(current_records)
+    current_stats = analyze_snapshot(read_snapshot(current_path))
 
     issues: List[str] = []
     if expected_count and current_stats["count"] != expected_count:
@@ -469,9 +834,12 @@ def command_validate_snapshots(
         )
 
     previous_stats = None
-    if previous_path and Path(previous_path).exists():
-        previous_records = read_snapshot(previous_path)
-        previous_stats = analyze_snapshot(previous_records)
+    if previous_path:
+        try:
+            previous_stats = analyze_snapshot(read_snapshot(previous_path))
+        except FileNotFoundError:
+            issues.append(f"Previous snapshot not found at {previous_path}")
+    if previous_stats is not None:
         if expected_count and previous_stats["count"] != expected_count:
             issues.append(
                 f"Previous snapshot count {previous_stats['count']} != expected {expected_count}"
@@ -481,15 +849,13 @@ def command_validate_snapshots(
         if missing_from_current:
             issues.append(
                 f"Current snapshot missing {len(missing_from_current)} teamId(s) found in previous snapshot: "
-                f"{', '.join(sorted(list(missing_from_current))[:5])}"
+                f"{', '.join(sorted(missing_from_current)[:5])}"
             )
         if missing_from_previous:
             issues.append(
                 f"Previous snapshot missing {len(missing_from_previous)} teamId(s) present now: "
-                f"{', '.join(sorted(list(missing_from_previous))[:5])}"
+                f"{', '.join(sorted(missing_from_previous)[:5])}"
             )
-    elif previous_path:
-        issues.append(f"Previous snapshot not found at {previous_path}")
 
     if issues:
         print("Snapshot validation failed:")
@@ -508,8 +874,23 @@ def command_validate_snapshots(
         )
 
 
+# One results/fixtures table cell: (text, class attribute, last link href)
+FixtureCell = Tuple[str, Optional[str], Optional[str]]
+
+
 class FixturesTableParser(HTMLParser):
     columns = ["date", "time", "homeTeam", "score", "awayTeam", "venue"]
+    __slots__ = (
+        "in_table",
+        "in_tbody",
+        "in_tr",
+        "in_td",
+        "current_cells",
+        "text_chunks",
+        "current_class",
+        "current_href",
+        "rows",
+    )
 
     def __init__(self) -> None:
         super().__init__()
@@ -517,17 +898,15 @@ class FixturesTableParser(HTMLParser):
         self.in_tbody = False
         self.in_tr = False
         self.in_td = False
-        self.current_cells: List[Dict[str, Optional[str]]] = []
-        self.current_text = ""
+        self.current_cells: List[FixtureCell] = []
+        self.text_chunks: List[str] = []
         self.current_class = ""
         self.current_href: Optional[str] = None
-        self.rows: List[List[Dict[str, Optional[str]]]] = []
+        self.rows: List[List[FixtureCell]] = []
 
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
         if tag == "table":
-            classes = (attrs_dict.get("class") or "").split()
-            self.in_table = "gms-table-results" in classes
+            self.in_table = has_class(get_attr(attrs, "class"), "gms-table-results")
         elif tag == "tbody" and self.in_table:
             self.in_tbody = True
         elif tag == "tr" and self.in_tbody:
@@ -535,24 +914,20 @@ class FixturesTableParser(HTMLParser):
             self.current_cells = []
         elif tag == "td" and self.in_tr:
             self.in_td = True
-            self.current_text = ""
-            self.current_class = attrs_dict.get("class", "")
+            self.text_chunks = []
+            self.current_class = get_attr(attrs, "class", "")
             self.current_href = None
         elif tag == "a" and self.in_td:
-            self.current_href = attrs_dict.get("href")
+            self.current_href = get_attr(attrs, "href")
 
     def handle_data(self, data):
         if self.in_td:
-            self.current_text += data
+            self.text_chunks.append(data)
 
     def handle_endtag(self, tag):
         if tag == "td" and self.in_td:
             self.current_cells.append(
-                {
-                    "text": self.current_text.strip(),
-                    "class": self.current_class,
-                    "href": self.current_href,
-                }
+                ("".join(self.text_chunks).strip(), self.current_class, self.current_href)
             )
             self.in_td = False
         elif tag == "tr" and self.in_tr:
@@ -565,56 +940,130 @@ class FixturesTableParser(HTMLParser):
             self.in_table = False
 
 
+def extract_fixture_rows(html: str) -> List[List[FixtureCell]]:
+    """
+    Return the cells of every results/fixtures table row as (text, class,
+    href) tuples, using lxml when available and FixturesTableParser otherwise.
+    """
+    tree = _parse_html_tree(html)
+    if tree is None:
+        parser = FixturesTableParser()
+        parser.feed(html or "")
+        return parser.rows
+
+    rows = []
+    for tr in tree.xpath(RESULTS_ROW_XPATH):
+        cells = []
+        for td in tr.iter("td"):
+            links = list(td.iter("a"))
+            cells.append(
+                (
+                    td.text_content().strip(),
+                    td.get("class", ""),
+                    links[-1].get("href") if links else None,
+                )
+            )
+        if cells:
+            rows.append(cells)
+    return rows
+
+
+MONTH_NUMBERS = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+
+
+def _small_int(text: str, max_digits: int) -> Optional[int]:
+    if text.isascii() and text.isdigit() and len(text) <= max_digits:
+        return int(text)
+    return None
+
+
+def parse_fixture_date(text: str) -> Optional[date]:
+    """Parse GMS dates like '15 Nov 2025' (strptime's "%d %b %Y") without strptime."""
+    parts = text.split()
+    if len(parts) != 3:
+        return None
+    day = _small_int(parts[0], 2)
+    month = MONTH_NUMBERS.get(parts[1].lower())
+    year = _small_int(parts[2], 4) if len(parts[2]) == 4 else None
+    if day is None or month is None or year is None:
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_fixture_datetime(fixture_date: date, time_text: str) -> Optional[datetime]:
+    """Combine a fixture date with an 'HH:MM' kickoff, or None if it is not a time (e.g. 'TBC')."""
+    hours_text, sep, minutes_text = time_text.partition(":")
+    hours = _small_int(hours_text, 2)
+    minutes = _small_int(minutes_text, 2)
+    if not sep or hours is None or minutes is None or hours > 23 or minutes > 59:
+        return None
+    return datetime(fixture_date.year, fixture_date.month, fixture_date.day, hours, minutes)
+
+
+_STATUS_MARKERS = (("gms-win", "win"), ("gms-loss", "loss"), ("gms-draw", "draw"))
+_COMPLETED = frozenset({"win", "loss", "draw", "result"})
+
+
+def _fixture_row(row_cells: List[FixtureCell]) -> Dict[str, Any]:
+    if len(row_cells) >= len(FixturesTableParser.columns):
+        date_cell, time_cell, home_cell, score_cell, away_cell, venue_cell = row_cells[:6]
+        return {
+            "date": date_cell[0],
+            "time": time_cell[0],
+            "homeTeam": home_cell[0],
+            "score": score_cell[0],
+            "scoreClass": score_cell[1],
+            "awayTeam": away_cell[0],
+            "venue": venue_cell[0],
+            "venueLink": venue_cell[2],
+        }
+
+    # Short rows only get the columns they actually have
+    row = {}
+    for col_name, (text, class_attr, _) in zip(FixturesTableParser.columns, row_cells):
+        row[col_name] = text
+        if col_name == "score":
+            row["scoreClass"] = class_attr
+    return row
+
+
 def parse_results_and_fixtures(html: str) -> List[Dict[str, Optional[str]]]:
-    parser = FixturesTableParser()
-    parser.feed(html or "")
     fixtures = []
 
-    for row_cells in parser.rows:
-        row = {}
-        for col_name, cell in zip(FixturesTableParser.columns, row_cells):
-            row[col_name] = cell.get("text", "")
-            if col_name == "score":
-                row["scoreClass"] = cell.get("class", "")
-            if col_name == "venue":
-                row["venueLink"] = cell.get("href")
-        fixtures.append(row)
-
-    for fixture in fixtures:
+    for row_cells in extract_fixture_rows(html):
+        fixture = _fixture_row(row_cells)
         date_text = fixture.get("date", "")
         time_text = fixture.get("time", "")
-        try:
-            fixture_date = datetime.strptime(date_text, "%d %b %Y").date()
-        except ValueError:
-            fixture_date = None
-        fixture["dateObj"] = fixture_date
-        fixture["dateIso"] = fixture_date.isoformat() if fixture_date else None
-
+        fixture_date = parse_fixture_date(date_text)
         if fixture_date and time_text:
-            try:
-                fixture_dt = datetime.strptime(
-                    f"{date_text} {time_text}", "%d %b %Y %H:%M"
-                )
-            except ValueError:
-                fixture_dt = None
+            fixture_dt = parse_fixture_datetime(fixture_date, time_text)
         else:
             fixture_dt = None
-        fixture["dateTime"] = fixture_dt.isoformat() if fixture_dt else None
 
         score_class = fixture.get("scoreClass") or ""
         score_text = (fixture.get("score") or "").strip()
-        if "gms-win" in score_class:
-            status = "win"
-        elif "gms-loss" in score_class:
-            status = "loss"
-        elif "gms-draw" in score_class:
-            status = "draw"
-        elif score_text:
-            status = "result"
-        else:
-            status = "pending"
-        fixture["status"] = status
-        fixture["completed"] = status in {"win", "loss", "draw", "result"}
+        status = next(
+            (name for marker, name in _STATUS_MARKERS if marker in score_class),
+            "result" if score_text else "pending",
+        )
+
+        fixture.update(
+            dateObj=fixture_date,
+            dateIso=fixture_date.isoformat() if fixture_date else None,
+            dateTime=fixture_dt.isoformat() if fixture_dt else None,
+            status=status,
+            completed=status in _COMPLETED,
+        )
+        fixtures.append(fixture)
 
     return fixtures
 
@@ -643,35 +1092,137 @@ def weekend_range(reference: Optional[str] = None) -> Tuple[date, date]:
     return saturday, sunday
 
 
+def build_session() -> requests.Session:
+    """
+    Create a Session whose connection pool is large enough for concurrent
+    fetches, so pooled HTTPS connections are reused instead of re-handshaked.
+    Transient gateway errors are retried by urllib3 with a short backoff;
+    429s are left to GMSClient._get, which knows about Retry-After.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=HTTP_TRANSIENT_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+class ResponseCache:
+    """
+    SQLite store of GMS response bodies keyed by URL, kept together with their
+    ETag/Last-Modified validators. It is only used for conditional requests:
+    each cached body is still revalidated, and a 304 means it can be reused
+    without downloading it again.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            ensure_dir(self.path.parent)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)"
+            )
+        return self._conn
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+    def put(
+        self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, body),
+            )
+            conn.commit()
+
+
 @dataclass
 class GMSClient:
     rate_limit_ms: int = 1200
     retry_limit: int = 4
-    session: requests.Session = requests.Session()
+    session: requests.Session = field(default_factory=build_session)
+    # Token bucket refilling one token every rate_limit_ms. The default burst
+    # of 1 keeps the original strict spacing (no two requests closer than
+    # rate_limit_ms); callers may opt in to a larger burst, which lets that
+    # many requests start back to back on a full bucket.
+    burst: int = 1
+    cache: Optional[ResponseCache] = field(
+        default_factory=lambda: ResponseCache(DEFAULT_HTTP_CACHE)
+    )
 
     def __post_init__(self):
-        self._next_allowed = 0.0
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._rate_lock = threading.Lock()
 
     def _respect_rate_limit(self):
-        now = time.time()
-        if now < self._next_allowed:
-            sleep_for = self._next_allowed - now
-            time.sleep(sleep_for)
+        if self.rate_limit_ms <= 0:
+            return
+        refill_per_second = 1000.0 / self.rate_limit_ms
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    self._tokens = min(
+                        float(self.burst),
+                        self._tokens + (now - self._last_refill) * refill_per_second,
+                    )
+                    self._last_refill = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / refill_per_second
+            # Sleep outside the lock so other workers can keep checking the bucket
+            time.sleep(wait)
 
     def _schedule_next_window(self, delay_ms: int):
-        self._next_allowed = time.time() + delay_ms / 1000.0
-
-    def _get(self, url: str) -> requests.Response:
+        # Back off every worker after a 429: nothing starts until the delay has
+        # passed, then a single request may go before the bucket refills
+        with self._rate_lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + delay_ms / 1000.0)
+            self._tokens = 1.0
+            self._last_refill = self._blocked_until
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
         for attempt in range(1, self.retry_limit + 1):
             self._respect_rate_limit()
-            response = self.session.get(url, timeout=20)
+            response = self.session.get(url, headers=headers, timeout=20)
 
             if response.status_code == 429:
                 retry_after = response.headers.get("Retry-After")
                 if retry_after and retry_after.isdigit():
                     delay = int(retry_after) * 1000
                 else:
-                    delay = self.rate_limit_ms * (2 ** attempt)
+                    # Jitter the exponential backoff so parallel runs that hit
+                    # the limit together do not all retry in lockstep
+                    delay = min(RETRY_BACKOFF_CAP_MS, self.rate_limit_ms * (2 ** attempt))
+                    delay = int(delay * random.uniform(0.5, 1.5))
                 self._schedule_next_window(delay)
                 if attempt == self.retry_limit:
                     response.raise_for_status()
@@ -679,18 +1230,39 @@ class GMSClient:
                 continue
 
             response.raise_for_status()
-            self._schedule_next_window(self.rate_limit_ms)
             return response
         raise RuntimeError("Failed to fetch after retries")
 
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        """GET a GMS JSON payload, revalidating any cached copy with ETag/If-Modified-Since."""
+        cached = self.cache.get(url) if self.cache else None
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self._get(url, headers=headers or None)
+        if response.status_code == 304 and cached:
+            return loads_json(cached[2])
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache and (etag or last_modified):
+            self.cache.put(url, etag, last_modified, response.content)
+        # Parse the raw bytes directly rather than letting requests guess a charset
+        return loads_json(response.content)
+
     def get_competitions_for_team(self, team_id: str) -> List[Dict[str, str]]:
         url = GMS_COMPETITIONS_URL.format(team_id=team_id.strip())
-        data = self._get(url).json()
+        data = self._get_json(url)
         return parse_competitions(data.get("html", ""))
 
     def get_team_row(self, team_id: str, comp_id: str) -> Dict[str, str]:
         url = build_show_url("league", team_id, comp_id)
-        data = self._get(url).json()
+        data = self._get_json(url)
         parsed = parse_league_table(data.get("html", ""), team_id)
         if not parsed:
             raise ValueError(f"Team {team_id} not found in competition {comp_id}")
@@ -700,7 +1272,7 @@ class GMSClient:
         self, team_id: str, comp_id: Optional[str] = None
     ) -> Dict[str, Optional[str]]:
         url = build_show_url("league", team_id, comp_id)
-        data = self._get(url).json()
+        data = self._get_json(url)
         parsed = parse_team_summary(data.get("html", ""), team_id)
         if not parsed:
             raise ValueError("Unable to parse team summary table")
@@ -712,66 +1284,92 @@ class GMSClient:
         self, team_id: str, comp_id: str
     ) -> List[Dict[str, Optional[str]]]:
         url = build_show_url("results+fixtures", team_id, comp_id)
-        data = self._get(url).json()
+        data = self._get_json(url)
         return parse_results_and_fixtures(data.get("html", ""))
 
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> GMSClient:
+    """
+    Shared GMSClient for the CLI commands, so commands run in the same process
+    reuse one connection pool and one rate-limit bucket.
+    """
+    client = GMSClient()
+    atexit.register(client.session.close)
+    return client
+
+
 def load_team_file(team_file: Path) -> List[Dict[str, str]]:
     team_file = resolve_repo_path(team_file)
-    with team_file.open("r", encoding="utf-8") as fh:
-        teams = json.load(fh)
-        if not isinstance(teams, list):
-            raise ValueError("teamIDs.json must contain a list of objects")
-        return teams
+    teams = loads_json(team_file.read_bytes())
+    if not isinstance(teams, list):
+        raise ValueError("teamIDs.json must contain a list of objects")
+    return teams
 
 
-def command_competitions(team_file: Path, output_file: Path):
-    client = GMSClient()
-    teams = load_team_file(team_file)
-    output = []
+def build_competition_record(client: GMSClient, entry: Dict[str, str], idx: int) -> Dict:
+    team_id = entry.get("teamId")
+    name = entry.get("name") or f"Team {idx}"
 
-    for idx, entry in enumerate(teams, start=1):
-        team_id = entry.get("teamId")
-        name = entry.get("name") or f"Team {idx}"
+    if not team_id:
+        return {"name": name, "error": "Missing teamId"}
 
-        if not team_id:
-            output.append({"name": name, "error": "Missing teamId"})
-            continue
+    try:
+        competitions = client.get_competitions_for_team(team_id)
+        selected = select_competition(competitions)
+        record = {
+            "name": name,
+            "teamId": team_id,
+            "competitions": competitions,
+        }
+        if selected:
+            record["compId"] = selected["compId"]
+            record["compLabel"] = selected["label"]
+        return record
+    except Exception as exc:  # pragma: no cover - diagnostic
+        return {"name": name, "teamId": team_id, "error": str(exc)}
 
-        try:
-            competitions = client.get_competitions_for_team(team_id)
-            selected = select_competition(competitions)
-            record = {
-                "name": name,
-                "teamId": team_id,
-                "competitions": competitions,
-            }
-            if selected:
-                record["compId"] = selected["compId"]
-                record["compLabel"] = selected["label"]
-            output.append(record)
-        except Exception as exc:  # pragma: no cover - diagnostic
-            output.append({"name": name, "teamId": team_id, "error": str(exc)})
-
-    save_json(output, output_file)
-    print(json.dumps(output, indent=2))
+
+def command_competitions(
+    team_file: Path,
+    output_file: Path,
+    echo: bool = False,
+    workers: int = FETCH_WORKERS,
+    client: Optional[GMSClient] = None,
+):
+    client = client or get_client()
+    teams = load_team_file(team_file)
+    output = map_concurrently(
+        lambda job: build_competition_record(client, job[1], job[0]),
+        enumerate(teams, start=1),
+        workers,
+    )
+
+    encoded = save_json(output, output_file)
+    if echo:
+        print_json(output, encoded)
     print(f"\nSaved {len(output)} entries to {output_file.resolve()}")
 
 
-def command_team_data(team_id: str, comp_id: str):
-    client = GMSClient()
+def command_team_data(team_id: str, comp_id: str, client: Optional[GMSClient] = None):
+    client = client or get_client()
     data = client.get_team_row(team_id, comp_id)
-    print(json.dumps(data, indent=2))
+    print_json(data)
 
 
 def command_team_summary(
-    team_id: str, comp_id: Optional[str], output_file: Optional[Path]
+    team_id: str,
+    comp_id: Optional[str],
+    output_file: Optional[Path],
+    echo: bool = False,
+    client: Optional[GMSClient] = None,
 ):
-    client = GMSClient()
+    client = client or get_client()
     data = client.get_team_summary(team_id, comp_id)
-    print(json.dumps(data, indent=2))
+    encoded = save_json(data, output_file) if output_file else None
+    if echo or not output_file:
+        print_json(data, encoded)
     if output_file:
-        save_json(data, output_file)
         print(f"\nSaved team summary to {output_file.resolve()}")
 
 
@@ -793,9 +1391,14 @@ def serialize_fixtures(fixtures: List[Dict[str, Optional[str]]]):
 
 
 def command_recent_results(
-    team_id: str, comp_id: str, weekend_str: Optional[str], output_file: Optional[Path]
+    team_id: str,
+    comp_id: str,
+    weekend_str: Optional[str],
+    output_file: Optional[Path],
+    echo: bool = False,
+    client: Optional[GMSClient] = None,
 ):
-    client = GMSClient()
+    client = client or get_client()
     fixtures = client.get_results_and_fixtures(team_id, comp_id)
     start, end = weekend_range(weekend_str)
     selected = weekend_fixtures(fixtures, start, end)
@@ -807,12 +1410,14 @@ def command_recent_results(
         "fixtures": serialize_fixtures(selected),
     }
 
-    print(json.dumps(payload, indent=2))
+    encoded = save_json(payload, output_file) if output_file else None
+    if echo or not output_file:
+        print_json(payload, encoded)
     if output_file:
-        save_json(payload, output_file)
         print(f"\nSaved weekend results to {output_file.resolve()}")
 
 
+@functools.lru_cache(maxsize=256)
 def determine_category_gender(team_name: str, comp_label: str) -> str:
     """
     Determine if a team is Men's or Women's based on name or competition.
@@ -834,6 +1439,33 @@ def determine_category_gender(team_name: str, comp_label: str) -> str:
     return "men"
 
 
+# Competition label noise stripped from scoreboard division names
+DIVISION_NOISE_RE = re.compile(
+    "|".join(re.escape(noise) for noise in (*COMP_LABEL_PREFIXES, SEASON_SUFFIX))
+)
+DASH_SCORE_RE = re.compile(r"(\d+) - (\d+)")
+COLON_SCORE_RE = re.compile(r"\s*(\d+)\s*:\s*(\d+)\s*(?::.*)?", re.S)
+
+
+SCOREBOARD_CSV_HEADER = ("Team", "Opponent", "Match_Time", "Location", "Division")
+
+
+@functools.lru_cache(maxsize=256)
+def team_number(team_name: str) -> int:
+    """First standalone number in a team name ("St Albans 3 (M)" -> 3), else 999."""
+    nums = [int(s) for s in team_name.split() if s.isdigit()]
+    return nums[0] if nums else 999
+
+
+@functools.lru_cache(maxsize=128)
+def clean_division(comp_label: str) -> str:
+    """
+    Division name cleaning, once per distinct competition label.
+    e.g. "East Open - Men's Division 1 South (2025-2026)" -> "Division 1 South"
+    """
+    return DIVISION_NOISE_RE.sub("", comp_label)
+
+
 def format_scoreboard_fixture(
     fixture: Dict[str, Any], 
     my_team_name: str, 
@@ -868,17 +1500,8 @@ def format_scoreboard_fixture(
         ha = "a"
         location = "Away"
 
-    # Division name cleaning
-    # e.g. "East Open - Men's Division 1 South (2025-2026)" -> "Division 1 South"
-    division = comp_label
-    # Remove simple prefixes if present (using our existing helper or more aggressive)
-    if "East Open - Men's " in division:
-        division = division.replace("East Open - Men's ", "")
-    if "East Women's " in division:
-        division = division.replace("East Women's ", "")
-    if " (2025-2026)" in division:
-        division = division.replace(" (2025-2026)", "")
-        
+    division = clean_division(comp_label)
+
     # Scores
     # score text "2 - 1" or similar? 
     # The parser puts the score string in 'score'. 
@@ -886,19 +1509,13 @@ def format_scoreboard_fixture(
     score_str = fixture.get("score", "").strip()
     home_score = None
     away_score = None
-    
-    if " - " in score_str:
-        parts = score_str.split(" - ")
-        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-            home_score = int(parts[0])
-            away_score = int(parts[1])
-    elif ":" in score_str:
-        parts = score_str.split(":")
-        p0 = parts[0].strip()
-        p1 = parts[1].strip()
-        if len(parts) >= 2 and p0.isdigit() and p1.isdigit():
-            home_score = int(p0)
-            away_score = int(p1)
+
+    # "2 - 1" is the usual form; "2:1" is only considered without a " - "
+    score_re = DASH_SCORE_RE if " - " in score_str else COLON_SCORE_RE
+    score_match = score_re.fullmatch(score_str)
+    if score_match:
+        home_score = int(score_match[1])
+        away_score = int(score_match[2])
 
     return {
         "date": fixture.get("dateTime"), # ISO format expected
@@ -924,12 +1541,8 @@ def load_previous_scoreboard(output_dir: Path) -> Dict[str, Any]:
     Returns a dict mapping fixtureId -> fixture_entry.
     """
     path = output_dir / "weekend_fixtures.json"
-    if not path.exists():
-        return {}
-    
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads_json(path.read_bytes())
         
         lookup = {}
         for cat in ["home", "away"]:
@@ -944,14 +1557,35 @@ def load_previous_scoreboard(output_dir: Path) -> Dict[str, Any]:
 
 
 
+def scoreboard_unchanged(path: Path, home: List[Dict[str, Any]], away: List[Dict[str, Any]]) -> bool:
+    """True if the weekend_fixtures.json at `path` already lists exactly these fixtures."""
+    try:
+        previous = loads_json(path.read_bytes())
+    except (OSError, ValueError):
+        return False
+    return isinstance(previous, dict) and previous.get("home") == home and previous.get("away") == away
+
+
+def fetch_team_fixtures(
+    client: GMSClient, entry: Dict[str, str]
+) -> Tuple[Optional[List[Dict[str, Optional[str]]]], Optional[Exception]]:
+    """Return (fixtures, None) for a config entry, or (None, error) if the fetch failed."""
+    try:
+        return client.get_results_and_fixtures(entry["teamId"], entry["compId"]), None
+    except Exception as exc:  # pragma: no cover - diagnostic
+        return None, exc
+
+
 def command_update_scoreboard(
     config_file: Path, 
     output_dir: Path,
-    weekend_str: Optional[str] = None
+    weekend_str: Optional[str] = None,
+    client: Optional[GMSClient] = None,
+    workers: int = FETCH_WORKERS,
 ):
     print(f"Updating scoreboard data in {output_dir} using config {config_file}")
     
-    client = GMSClient()
+    client = client or get_client()
     teams_config = load_team_file(config_file)
     
     start, end = weekend_range(weekend_str)
@@ -963,15 +1597,49 @@ def command_update_scoreboard(
 
     scoreboard_home = []
     scoreboard_away = []
-    all_fixtures_flat = []
+    # CSV rows per category, filled in the same pass that splits home/away
+    fixtures_by_category: Dict[str, List[Dict[str, Any]]] = {"men": [], "women": []}
+
+    def add_to_category(fixture):
+        bucket = fixtures_by_category.get(fixture["category"])
+        if bucket is not None:
+            bucket.append(fixture)
     seen_matches = set()
 
-    # Map team name to previous fixtures to handle complete fetch failure
-    previous_team_fixtures = {}
-    for fix in previous_fixtures_map.values():
-        tname = fix.get("team")
-        if tname:
-            previous_team_fixtures.setdefault(tname, []).append(fix)
+    # Map team name to previous fixtures to handle complete fetch failure.
+    # Only needed when a fetch fails, so it's built on first use.
+    previous_team_fixtures: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    def get_previous_team_fixtures(name):
+        nonlocal previous_team_fixtures
+        if previous_team_fixtures is None:
+            previous_team_fixtures = defaultdict(list)
+            for fix in previous_fixtures_map.values():
+                tname = fix.get("team")
+                if tname:
+                    previous_team_fixtures[tname].append(fix)
+        return previous_team_fixtures.get(name, [])
+
+    # Fetch every team up front on the worker pool; the loop below then
+    # formats and merges them in config order so the output stays stable.
+    # Entries sharing a (teamId, compId) pair are only fetched once.
+    jobs = [
+        (idx, entry)
+        for idx, entry in enumerate(teams_config, start=1)
+        if entry.get("teamId") and entry.get("compId")
+    ]
+    unique_entries: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for _, entry in jobs:
+        unique_entries.setdefault((entry["teamId"], entry["compId"]), entry)
+    fetched_by_pair = dict(
+        zip(
+            unique_entries,
+            map_concurrently(
+                lambda entry: fetch_team_fixtures(client, entry), list(unique_entries.values()), workers
+            ),
+        )
+    )
+    fetched = {idx: fetched_by_pair[(entry["teamId"], entry["compId"])] for idx, entry in jobs}
 
     for idx, entry in enumerate(teams_config, start=1):
         name = entry.get("name")
@@ -985,7 +1653,9 @@ def command_update_scoreboard(
             
         print(f"Fetching {name}...")
         try:
-            raw_fixtures = client.get_results_and_fixtures(team_id, comp_id)
+            raw_fixtures, fetch_error = fetched[idx]
+            if fetch_error is not None:
+                raise fetch_error
             # Filter for weekend
             weekend = weekend_fixtures(raw_fixtures, start, end)
             
@@ -1038,7 +1708,7 @@ def command_update_scoreboard(
                         print(f"  [Rollback] Keeping score for {name} (was {prev['home_score']}-{prev['away_score']}, now None)")
                         formatted = prev
 
-                all_fixtures_flat.append(formatted)
+                add_to_category(formatted)
                 
                 if formatted["_ha"] == "h":
                     scoreboard_home.append(formatted)
@@ -1048,7 +1718,7 @@ def command_update_scoreboard(
         except Exception as e:
             print(f"Error fetching {name}: {e}")
             # Fallback: use previous data for this team if fetch failed completely
-            saved_fixtures = previous_team_fixtures.get(name, [])
+            saved_fixtures = get_previous_team_fixtures(name)
             if saved_fixtures:
                 print(f"  [Rollback] Fetch failed. Using {len(saved_fixtures)} saved fixtures for {name}.")
                 for sf in saved_fixtures:
@@ -1064,7 +1734,7 @@ def command_update_scoreboard(
                          continue
                     seen_matches.add(dedupe_key)
 
-                    all_fixtures_flat.append(sf)
+                    add_to_category(sf)
                     if sf.get("_ha") == "h":
                         scoreboard_home.append(sf)
                     else:
@@ -1087,37 +1757,49 @@ def command_update_scoreboard(
     }
     
     out_json_path = output_dir / "weekend_fixtures.json"
-    save_json(json_output, out_json_path)
-    print(f"Wrote {out_json_path}")
+    if scoreboard_unchanged(out_json_path, scoreboard_home, scoreboard_away):
+        # Leave the file (and its generated_at) alone so no-op runs don't commit
+        print(f"No fixture changes, kept {out_json_path}")
+    else:
+        save_json(json_output, out_json_path)
+        print(f"Wrote {out_json_path}")
 
     # 2. Generate CSVs
     # Sort key: Team name numeric part? Or just team name. 
     # filter.py logic: sort by team number.
     def get_team_number(item):
-        val = item["team"]
-        nums = [int(s) for s in val.split() if s.isdigit()]
-        return nums[0] if nums else 999
+        return team_number(item["team"])
 
-    mens_fixtures = [x for x in all_fixtures_flat if x["category"] == "men"]
-    womens_fixtures = [x for x in all_fixtures_flat if x["category"] == "women"]
+    mens_fixtures = fixtures_by_category["men"]
+    womens_fixtures = fixtures_by_category["women"]
     
     mens_fixtures.sort(key=get_team_number)
     womens_fixtures.sort(key=get_team_number)
     
     def write_csv(fixtures, filename):
         path = output_dir / filename
-        with path.open('w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Team', 'Opponent', 'Match_Time', 'Location', 'Division'])
-            for f in fixtures:
-                opponent = f['away_team'] if f['location'] == 'Home' else f['home_team']
-                writer.writerow([
-                    f['team'],
-                    opponent,
-                    f['kickoff'],
-                    f['location'],
-                    f['division']
-                ])
+        rows = (
+            (
+                f['team'],
+                f['away_team'] if f['location'] == 'Home' else f['home_team'],
+                f['kickoff'],
+                f['location'],
+                f['division'],
+            )
+            for f in fixtures
+        )
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        writer.writerow(SCOREBOARD_CSV_HEADER)
+        writer.writerows(rows)
+        content = buffer.getvalue().encode('utf-8')
+        try:
+            if path.read_bytes() == content:
+                print(f"No changes, kept {path}")
+                return
+        except OSError:
+            pass
+        path.write_bytes(content)
         print(f"Wrote {path}")
 
     write_csv(mens_fixtures, "mens_fixtures.csv")
@@ -1132,6 +1814,9 @@ def command_bulk_team_data(
     previous_path: Optional[Path] = None,
     rotate: bool = False,
     snapshot_date: Optional[str] = None,
+    workers: int = FETCH_WORKERS,
+    echo: bool = False,
+    client: Optional[GMSClient] = None,
 ):
     config_file = resolve_repo_path(config_file)
     output_file = resolve_repo_path(output_file)
@@ -1147,7 +1832,7 @@ def command_bulk_team_data(
         target_output = qualified_snapshot_path(publish_path, "new")
         auto_snapshot = True
 
-    client = GMSClient()
+    client = client or get_client()
     teams = load_team_file(config_file)
 
     ordered_entries = []
@@ -1157,7 +1842,11 @@ def command_bulk_team_data(
     for idx, entry in enumerate(teams, start=1):
         key = make_entry_key(entry, idx)
         ordered_entries.append({"key": key, "entry": entry, "index": idx})
-        success, payload = fetch_team_record(client, entry, idx)
+
+    jobs = [(item["key"], item["entry"], item["index"]) for item in ordered_entries]
+    outcomes = fetch_team_records(client, jobs, workers)
+    for key, entry, idx in jobs:
+        success, payload = outcomes[key]
         if success:
             attach_snapshot_meta(payload, snapshot_date)
             records_by_key[key] = payload
@@ -1170,12 +1859,13 @@ def command_bulk_team_data(
         if not errors_by_key:
             break
         time.sleep(VALIDATION_BACKOFF_SECONDS * attempt)
-        pending_keys = list(errors_by_key.keys())
-        for key in pending_keys:
-            context = errors_by_key[key]
-            success, payload = fetch_team_record(
-                client, context["entry"], context["index"]
-            )
+        jobs = [
+            (key, context["entry"], context["index"])
+            for key, context in errors_by_key.items()
+        ]
+        outcomes = fetch_team_records(client, jobs, workers)
+        for key, _, _ in jobs:
+            success, payload = outcomes[key]
             if success:
                 attach_snapshot_meta(payload, snapshot_date)
                 records_by_key[key] = payload
@@ -1184,38 +1874,48 @@ def command_bulk_team_data(
                 errors_by_key[key]["message"] = payload
 
     fallback_used: List[str] = []
-    if errors_by_key and publish_path.exists():
+    if errors_by_key:
         fallback_map = load_fallback_map(publish_path)
         if fallback_map:
-            for key in list(errors_by_key.keys()):
-                entry = errors_by_key[key]["entry"]
+            fallback_snapshot = str(publish_path)
+            applied_at = (
+                datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+            )
+            fallback_meta = {
+                "source": "fallback",
+                "fallbackSnapshot": fallback_snapshot,
+                "fallbackAppliedAt": applied_at,
+            }
+            if snapshot_date:
+                fallback_meta["snapshotDate"] = snapshot_date
+            for key, context in errors_by_key.items():
+                entry = context["entry"]
                 team_id = entry.get("teamId")
-                if not team_id:
+                fallback_record = fallback_map.get(team_id) if team_id else None
+                if not fallback_record:
                     continue
-                fallback_record = fallback_map.get(team_id)
-                if fallback_record:
-                    record_copy = deep_copy_record(fallback_record)
-                    meta = record_copy.setdefault("meta", {})
-                    meta["source"] = "fallback"
-                    meta["fallbackSnapshot"] = str(publish_path)
-                    meta["fallbackAppliedAt"] = datetime.utcnow().isoformat()
-                    attach_snapshot_meta(record_copy, snapshot_date)
-                    records_by_key[key] = record_copy
-                    fallback_used.append(entry.get("name") or team_id)
-                    del errors_by_key[key]
-
-    results = []
-    for item in ordered_entries:
-        key = item["key"]
-        entry = item["entry"]
-        if key in records_by_key:
-            results.append(records_by_key[key])
-        else:
-            message = errors_by_key.get(key, {}).get("message", "Unknown error")
-            results.append(build_error_record(entry, message))
+                record_copy = copy_record_with_meta(fallback_record)
+                record_copy["meta"].update(fallback_meta)
+                records_by_key[key] = record_copy
+                fallback_used.append(entry.get("name") or team_id)
+            if fallback_used:
+                errors_by_key = {
+                    key: context
+                    for key, context in errors_by_key.items()
+                    if key not in records_by_key
+                }
+
+    # Every key has ended up in exactly one of the two dicts by now
+    final_by_key = {
+        key: build_error_record(context["entry"], context["message"])
+        for key, context in errors_by_key.items()
+    }
+    final_by_key.update(records_by_key)
+    results = [final_by_key[item["key"]] for item in ordered_entries]
 
-    save_json(results, target_output)
-    print(json.dumps(results, indent=2))
+    encoded = save_json(results, target_output)
+    if echo:
+        print_json(results, encoded)
     print(f"\nSaved {len(results)} team records to {target_output.resolve()}")
 
     if fallback_used:
@@ -1243,8 +1943,32 @@ def command_bulk_team_data(
                 )
 
 
+def add_stdout_flag(subparser: argparse.ArgumentParser, default_note: str) -> None:
+    subparser.add_argument(
+        "--stdout",
+        action="store_true",
+        help=f"Also print the JSON payload to stdout ({default_note})",
+    )
+
+
+def add_workers_flag(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "--workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Number of teams to fetch concurrently (default: {FETCH_WORKERS})",
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parse_args() does not modify it."""
     parser = argparse.ArgumentParser(description="Work with England Hockey GMS data.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always download GMS responses instead of revalidating {DEFAULT_HTTP_CACHE.name}",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     comp_parser = subparsers.add_parser("competitions", help="Fetch comp IDs for every team")
@@ -1260,10 +1984,18 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_COMP_OUTPUT,
         help=f"Where to save the merged team/competition JSON (default: {DEFAULT_COMP_OUTPUT})",
     )
+    add_workers_flag(comp_parser)
+    add_stdout_flag(comp_parser, "off by default")
+    comp_parser.set_defaults(
+        func=lambda args: command_competitions(
+            args.team_file, args.output, args.stdout, args.workers
+        )
+    )
 
     data_parser = subparsers.add_parser("team-data", help="Fetch league stats for a team")
     data_parser.add_argument("--team-id", required=True, help="Team UUID")
     data_parser.add_argument("--comp-id", required=True, help="Competition UUID")
+    data_parser.set_defaults(func=lambda args: command_team_data(args.team_id, args.comp_id))
 
     summary_parser = subparsers.add_parser(
         "team-summary", help="Fetch the summary league table for a team"
@@ -1276,6 +2008,12 @@ def build_parser() -> argparse.ArgumentParser:
     summary_parser.add_argument(
         "--output", type=Path, help="Optional file to save the summary JSON"
     )
+    add_stdout_flag(summary_parser, "always on without --output")
+    summary_parser.set_defaults(
+        func=lambda args: command_team_summary(
+            args.team_id, args.comp_id, args.output, args.stdout
+        )
+    )
 
     bulk_parser = subparsers.add_parser(
         "bulk-team-data", help="Fetch league stats for every team in the saved config"
@@ -1314,6 +2052,20 @@ def build_parser() -> argparse.ArgumentParser:
         "--snapshot-date",
         help="Optional ISO date/tag to store inside each exported record's metadata.",
     )
+    add_workers_flag(bulk_parser)
+    add_stdout_flag(bulk_parser, "off by default")
+    bulk_parser.set_defaults(
+        func=lambda args: command_bulk_team_data(
+            args.config,
+            args.output,
+            args.publish_path,
+            args.previous_path,
+            args.rotate_snapshots,
+            args.snapshot_date,
+            args.workers,
+            args.stdout,
+        )
+    )
 
     recent_parser = subparsers.add_parser(
         "recent-results",
@@ -1330,6 +2082,12 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional file to save the weekend fixtures JSON",
     )
+    add_stdout_flag(recent_parser, "always on without --output")
+    recent_parser.set_defaults(
+        func=lambda args: command_recent_results(
+            args.team_id, args.comp_id, args.weekend, args.output, args.stdout
+        )
+    )
 
     validate_parser = subparsers.add_parser(
         "validate-snapshots", help="Validate snapshot files before publishing"
@@ -1351,6 +2109,11 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Expected number of team entries; validation fails if counts differ.",
     )
+    validate_parser.set_defaults(
+        func=lambda args: command_validate_snapshots(
+            args.current, args.previous, args.expect_count
+        )
+    )
 
     sb_parser = subparsers.add_parser(
         "update-scoreboard", help="Update the scoreboard data (JSON + CSV) using GMS."
@@ -1371,6 +2134,12 @@ def build_parser() -> argparse.ArgumentParser:
         "--weekend",
         help="Optional weekend date (YYYY-MM-DD)",
     )
+    add_workers_flag(sb_parser)
+    sb_parser.set_defaults(
+        func=lambda args: command_update_scoreboard(
+            args.config, args.output_dir, args.weekend, workers=args.workers
+        )
+    )
 
     return parser
 
@@ -1378,28 +2147,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main():
     parser = build_parser()
     args = parser.parse_args()
-
-    if args.command == "competitions":
-        command_competitions(args.team_file, args.output)
-    elif args.command == "team-data":
-        command_team_data(args.team_id, args.comp_id)
-    elif args.command == "team-summary":
-        command_team_summary(args.team_id, args.comp_id, args.output)
-    elif args.command == "bulk-team-data":
-        command_bulk_team_data(
-            args.config,
-            args.output,
-            args.publish_path,
-            args.previous_path,
-            args.rotate_snapshots,
-            args.snapshot_date,
-        )
-    elif args.command == "recent-results":
-        command_recent_results(args.team_id, args.comp_id, args.weekend, args.output)
-    elif args.command == "validate-snapshots":
-        command_validate_snapshots(args.current, args.previous, args.expect_count)
-    elif args.command == "update-scoreboard":
-        command_update_scoreboard(args.config, args.output_dir, args.weekend)
+    if args.no_cache:
+        get_client().cache = None
+    args.func(args)
 
 
 if __name__ == "__main__":
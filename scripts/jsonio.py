@@ -0,0 +1,37 @@
+"""
+JSON and directory helpers shared by filter.py and gms_fetcher.py.
+
+orjson is used when it is installed, falling back to the standard library.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Directories already created by ensure_dir(); importing the module creates none
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(directory: Path) -> None:
+    """mkdir -p the directory once per process."""
+    if directory not in _ENSURED_DIRS:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+def loads_json(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(payload) -> bytes:
+    """Serialize payload to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
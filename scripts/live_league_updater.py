@@ -8,7 +8,8 @@ Usage:
     # Run continuously (every 5 minutes)
     python scripts/live_league_updater.py
 
-    # Run once and exit
+    # Run once and exit (preferred under cron / systemd timers / Task Scheduler,
+    # which restart cleanly after a crash and keep no idle process around)
     python scripts/live_league_updater.py --once
 
     # Custom interval (in minutes)
@@ -21,33 +22,48 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import subprocess
+import random
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import gms_fetcher  # noqa: E402
+
 CONFIG_DIR = REPO_ROOT / "config"
 LEAGUE_DATA_DIR = REPO_ROOT / "data" / "league"
-GMS_FETCHER = REPO_ROOT / "scripts" / "gms_fetcher.py"
 DEFAULT_CONFIG = CONFIG_DIR / "teamCompIDs.json"
 DEFAULT_OUTPUT = LEAGUE_DATA_DIR / "teamData.json"
 DEFAULT_PREVIOUS = LEAGUE_DATA_DIR / "teamData.prev.json"
 DEFAULT_INTERVAL_MINUTES = 5
+# Failed fetches are retried after RETRY_BASE_SECONDS * 2**failures (capped at
+# the interval) plus up to RETRY_JITTER_SECONDS of random jitter
+RETRY_BASE_SECONDS = 10
+RETRY_JITTER_SECONDS = 5
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def timestamp() -> str:
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+
+def log(message: str):
+    """Print a progress line prefixed with the local time."""
+    print(f"[{timestamp()}] {message}")
 
 
 def run_fetch(validate: bool = False, expect_count: int | None = None) -> bool:
     """
-    Run a single fetch cycle using gms_fetcher.py.
+    Run a single fetch cycle through gms_fetcher's bulk-team-data command.
 
     Returns:
         True if successful, False otherwise
     """
-    if not GMS_FETCHER.exists():
-        print(f"ERROR: gms_fetcher.py not found at {GMS_FETCHER}", file=sys.stderr)
-        return False
-
     if not DEFAULT_CONFIG.exists():
         print(
             f"ERROR: Config file not found at {DEFAULT_CONFIG}. Run 'gms_fetcher.py competitions' first.",
@@ -56,115 +72,76 @@ def run_fetch(validate: bool = False, expect_count: int | None = None) -> bool:
         return False
 
     # Generate snapshot date timestamp
-    snapshot_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Build the command
-    cmd = [
-        sys.executable,
-        str(GMS_FETCHER),
-        "bulk-team-data",
-        "--config",
-        str(DEFAULT_CONFIG),
-        "--output",
-        str(DEFAULT_OUTPUT),
-        "--publish-path",
-        str(DEFAULT_OUTPUT),
-        "--previous-path",
-        str(DEFAULT_PREVIOUS),
-        "--rotate-snapshots",
-        "--snapshot-date",
-        snapshot_date,
-    ]
-
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Fetching team data...")
+    snapshot_date = timestamp()
+
+    # gms_fetcher runs in-process, so each cycle skips interpreter start-up
+    # and reuses the fetcher's pooled HTTP session and response cache
+    log("Fetching team data...")
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=REPO_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-            encoding="utf-8",
+        gms_fetcher.command_bulk_team_data(
+            DEFAULT_CONFIG,
+            DEFAULT_OUTPUT,
+            publish_path=DEFAULT_OUTPUT,
+            previous_path=DEFAULT_PREVIOUS,
+            rotate=True,
+            snapshot_date=snapshot_date,
         )
-
-        if result.returncode != 0:
-            print(f"ERROR: Fetch failed with return code {result.returncode}", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            return False
-
-        # Print output from gms_fetcher
-        if result.stdout:
-            print(result.stdout)
-
-        # Run validation if requested
-        if validate:
-            validate_cmd = [
-                sys.executable,
-                str(GMS_FETCHER),
-                "validate-snapshots",
-                "--current",
-                str(DEFAULT_OUTPUT),
-                "--previous",
-                str(DEFAULT_PREVIOUS),
-            ]
-            if expect_count:
-                validate_cmd.extend(["--expect-count", str(expect_count)])
-
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Validating snapshots...")
-            validate_result = subprocess.run(
-                validate_cmd,
-                cwd=REPO_ROOT,
-                capture_output=True,
-                text=True,
-                check=False,
-                encoding="utf-8",
-            )
-
-            if validate_result.returncode != 0:
-                print("ERROR: Validation failed", file=sys.stderr)
-                if validate_result.stderr:
-                    print(validate_result.stderr, file=sys.stderr)
-                return False
-
-            if validate_result.stdout:
-                print(validate_result.stdout)
-
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Fetch completed successfully")
-        return True
-
+    except SystemExit as exc:
+        print(f"ERROR: Fetch failed with return code {exc.code}", file=sys.stderr)
+        return False
     except Exception as exc:
         print(f"ERROR: Exception during fetch: {exc}", file=sys.stderr)
         return False
 
+    # Run validation if requested
+    if validate:
+        log("Validating snapshots...")
+        try:
+            gms_fetcher.command_validate_snapshots(DEFAULT_OUTPUT, DEFAULT_PREVIOUS, expect_count)
+        except SystemExit:
+            print("ERROR: Validation failed", file=sys.stderr)
+            return False
+        except Exception as exc:
+            print(f"ERROR: Exception during validation: {exc}", file=sys.stderr)
+            return False
+
+    log("Fetch completed successfully")
+    return True
+
 
 def run_continuous(interval_minutes: int, validate: bool, expect_count: int | None):
     """Run fetch cycles continuously with the specified interval."""
     interval_seconds = interval_minutes * 60
-    print(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-        f"Starting live updater (interval: {interval_minutes} minutes)"
-    )
+    log(f"Starting live updater (interval: {interval_minutes} minutes)")
     print("Press Ctrl+C to stop")
 
     try:
+        failures = 0
         while True:
+            cycle_start = time.monotonic()
             success = run_fetch(validate=validate, expect_count=expect_count)
-            if not success:
-                print(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-                    "Fetch failed, will retry at next interval"
-                )
-
-            # Wait for next interval
-            print(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-                f"Next fetch in {interval_minutes} minutes..."
-            )
-            time.sleep(interval_seconds)
+            now = time.monotonic()
+            if success:
+                failures = 0
+                # Schedule from the start of this cycle so fetch time doesn't make
+                # the interval drift; skip ticks a slow fetch has already overrun
+                next_run = cycle_start + interval_seconds
+                if next_run <= now:
+                    next_run += ((now - next_run) // interval_seconds + 1) * interval_seconds
+                log(f"Next fetch in {(next_run - now) / 60:.1f} minutes...")
+            else:
+                # Retry sooner, backing off exponentially up to the normal
+                # interval; the jitter keeps several updaters from retrying together
+                failures += 1
+                delay = min(interval_seconds, RETRY_BASE_SECONDS * 2**failures)
+                delay += random.uniform(0, RETRY_JITTER_SECONDS)
+                next_run = now + delay
+                log(f"Fetch failed, retrying in {delay / 60:.1f} minutes...")
+            time.sleep(next_run - now)
 
     except KeyboardInterrupt:
-        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Stopping updater")
+        print()
+        log("Stopping updater")
         sys.exit(0)
 
 
@@ -24,6 +24,9 @@ headers = {
     "Content-Type": "application/json"
 }
 
+# Send the browser headers with every request made on the kept-alive session
+session.headers.update(headers)
+
 # Step 1: Authenticate to get connect.sid
 jwt_payload = {
     "username": "",
@@ -40,20 +43,23 @@ jwt_payload = {
     #print("\nTeam Sheet Status:", team_sheet_response.status_code)
     #print("Team Sheet Content:", team_sheet_response.text[:500])  # First 500 chars to avoid flooding console
 
-# Get matches data
-response = requests.get(MATCHES_URL, headers=headers)
-print(f"Response Status: {response.status_code}")
-
-if response.status_code == 200:
-    # Create filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = RAW_DATA_DIR / f"matches_data_{timestamp}.html"
-    
-    # Save the raw HTML response
-    with filename.open('w', encoding='utf-8') as f:
-        f.write(response.text)
-    
-    print(f"Data saved to {filename}")
-else:
-    print(f"Failed to get data: {response.status_code}")
-    print(response.text)
\ No newline at end of file
+# Get matches data, streaming the body straight to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+with session.get(MATCHES_URL, stream=True) as response:
+    print(f"Response Status: {response.status_code}")
+
+    if response.status_code == 200:
+        # Create filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = RAW_DATA_DIR / f"matches_data_{timestamp}.html"
+
+        # Save the raw HTML response
+        with filename.open('wb') as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+        print(f"Data saved to {filename}")
+    else:
+        print(f"Failed to get data: {response.status_code}")
+        print(response.text)
\ No newline at end of file
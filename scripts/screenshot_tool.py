@@ -1,65 +1,109 @@
 import argparse
 import asyncio
-import threading
-import socketserver
-import http.server
+import mimetypes
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urlsplit
 from playwright.async_api import async_playwright
 
+class PageSpec(NamedTuple):
+    name: str
+    path: str
+    width: int
+    height: int
+    # "jpeg" (with a quality) is much smaller for photo-heavy previews;
+    # text-heavy displays stay PNG so they remain crisp
+    image_type: str = "png"
+    quality: Optional[int] = None
+
+
 # Define the pages we want to screenshot
 # Paths are relative to the repo root
 PAGES = [
-    {
-        "name": "marketing_home",
-        "path": "marketing_site/index.html",
-        "width": 1920,
-        "height": 1080
-    },
-    {
-        "name": "scoreboard_home",
-        "path": "apps/scoreboard/homeFixtures.html",
-        "width": 1080,
-        "height": 1920 # Portrait
-    },
-    {
-        "name": "scoreboard_away",
-        "path": "apps/scoreboard/awayFixtures.html",
-        "width": 1080,
-        "height": 1920 # Portrait
-    },
-    {
-        "name": "league_men",
-        "path": "apps/league/leagueOfLeagues-men.html",
-        "width": 1080,
-        "height": 1920
-    },
-    {
-        "name": "league_women",
-        "path": "apps/league/leagueOfLeagues-women.html",
-        "width": 1080,
-        "height": 1920
-    }
+    PageSpec("marketing_home", "marketing_site/index.html", 1920, 1080, "jpeg", 85),
+    PageSpec("scoreboard_home", "apps/scoreboard/homeFixtures.html", 1080, 1920),  # Portrait
+    PageSpec("scoreboard_away", "apps/scoreboard/awayFixtures.html", 1080, 1920),  # Portrait
+    PageSpec("league_men", "apps/league/leagueOfLeagues-men.html", 1080, 1920),
+    PageSpec("league_women", "apps/league/leagueOfLeagues-women.html", 1080, 1920),
 ]
 
-class QuietHandler(http.server.SimpleHTTPRequestHandler):
-    def log_message(self, format, *args):
-        pass
+# Upper bound on pages rendering at the same time
+MAX_CONCURRENT_PAGES = 4
+
+# Pages sharing a viewport share one browser context
+VIEWPORT_GROUPS: Dict[Tuple[int, int], List[PageSpec]] = {}
+for _page in PAGES:
+    VIEWPORT_GROUPS.setdefault((_page.width, _page.height), []).append(_page)
+
+# Resolves once fonts are loaded and every finite CSS animation (e.g. the
+# staggered fixture slide-ins) has finished, instead of a fixed sleep
+SETTLE_SCRIPT = """async () => {
+    await document.fonts.ready;
+    const finite = document.getAnimations().filter(
+        (animation) => animation.effect && animation.effect.getComputedTiming().endTime !== Infinity
+    );
+    await Promise.all(finite.map((animation) => animation.finished.catch(() => null)));
+}"""
+
+# Pages are loaded from this made-up origin and every request to it is
+# answered from the repo on disk, so relative fetch() calls work without a
+# local HTTP server (they are blocked on file:// URLs)
+BASE_URL = "http://sahc.local"
+
+
+def make_repo_route(repo_root: Path):
+    async def serve_from_repo(route):
+        relative = unquote(urlsplit(route.request.url).path).lstrip("/")
+        path = (repo_root / relative).resolve()
+        if not path.is_relative_to(repo_root) or not path.is_file():
+            await route.fulfill(status=404, body="Not found")
+            return
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        await route.fulfill(status=200, body=path.read_bytes(), content_type=content_type)
+
+    return serve_from_repo
+
+
+async def capture_page(context, page_config: PageSpec, output_dir: Path):
+    print(f"Capturing {page_config.name}...")
+    page = await context.new_page()
+
+    # Listen for console logs
+    page.on("console", lambda msg: print(f"BROWSER CONSOLE ({page_config.name}): {msg.text}"))
+    page.on("pageerror", lambda exc: print(f"BROWSER ERROR ({page_config.name}): {exc}"))
+
+    try:
+        url = f"{BASE_URL}/{page_config.path}"
+        response = await page.goto(url, wait_until="domcontentloaded")
+
+        if response.status != 200:
+            print(f"Error loading {url}: Status {response.status}")
+            return
+
+        # Specific waits based on page type
+        try:
+            if "scoreboard" in page_config.name:
+                # Wait for fixtures to load
+                await page.wait_for_selector(".fixture, .no-fixtures-message", timeout=10000)
+            elif "league" in page_config.name:
+                # Wait for table rows
+                await page.wait_for_selector(".table-row", timeout=10000)
+
+            # Let pending requests, web fonts and the entry animations finish
+            await page.wait_for_load_state("networkidle", timeout=5000)
+            await page.evaluate(SETTLE_SCRIPT)
+
+        except Exception as e:
+            print(f"Warning: Timeout waiting for content on {page_config.name}: {e}")
+
+        extension = "jpg" if page_config.image_type == "jpeg" else page_config.image_type
+        output_file = output_dir / f"{page_config.name}.{extension}"
+        options = {"quality": page_config.quality} if page_config.quality is not None else {}
+        await page.screenshot(path=output_file, full_page=True, type=page_config.image_type, **options)
+        print(f" - Saved to {output_file}")
+    finally:
+        await page.close()
 
-def start_server(root_dir):
-    # Find a free port
-    httpd = socketserver.TCPServer(("localhost", 0), QuietHandler)
-    port = httpd.server_address[1]
-    print(f"Starting local server at http://localhost:{port} serving {root_dir}")
-    
-    # Serve from the repo root
-    # We need to change CWD for SimpleHTTPRequestHandler
-    import os
-    os.chdir(root_dir)
-    
-    server_thread = threading.Thread(target=httpd.serve_forever)
-    server_thread.daemon = True
-    server_thread.start()
-    return port
 
 async def take_screenshots(output_dir: Path):
     output_dir.mkdir(exist_ok=True, parents=True)
@@ -67,55 +111,33 @@ async def take_screenshots(output_dir: Path):
     # Resolve repo root (assumes this script is in scripts/)
     repo_root = Path(__file__).parent.parent.resolve()
     
-    # Start local server
-    port = start_server(repo_root)
-    base_url = f"http://localhost:{port}"
-    
     async with async_playwright() as p:
         browser = await p.chromium.launch()
         
-        for page_config in PAGES:
-            print(f"Capturing {page_config['name']}...")
-            
-            context = await browser.new_context(
-                viewport={"width": page_config["width"], "height": page_config["height"]},
-                device_scale_factor=2.0 # High DPI
-            )
-            page = await context.new_page()
-            
-            # Listen for console logs
-            page.on("console", lambda msg: print(f"BROWSER CONSOLE: {msg.text}"))
-            page.on("pageerror", lambda exc: print(f"BROWSER ERROR: {exc}"))
-            
-            # Use HTTP URL
-            url = f"{base_url}/{page_config['path']}"
-            response = await page.goto(url, wait_until="domcontentloaded")
-            
-            if response.status != 200:
-                 print(f"Error loading {url}: Status {response.status}")
-                 continue
-
-            # Specific waits based on page type
-            try:
-                if "scoreboard" in page_config["name"]:
-                    # Wait for fixtures to load
-                    await page.wait_for_selector(".fixture, .no-fixtures-message", timeout=10000)
-                elif "league" in page_config["name"]:
-                    # Wait for table rows
-                    await page.wait_for_selector(".table-row", timeout=10000)
-                
-                # Additional buffer for layout
-                await page.wait_for_timeout(1000)
-                
-            except Exception as e:
-                print(f"Warning: Timeout waiting for content on {page_config['name']}: {e}")
-
-            output_file = output_dir / f"{page_config['name']}.png"
-            await page.screenshot(path=output_file, full_page=True)
-            print(f" - Saved to {output_file}")
-            
-            await context.close()
-            
+        contexts = {}
+        try:
+            for width, height in VIEWPORT_GROUPS:
+                context = await browser.new_context(
+                    viewport={"width": width, "height": height},
+                    device_scale_factor=2.0 # High DPI
+                )
+                await context.route(f"{BASE_URL}/**", make_repo_route(repo_root))
+                contexts[(width, height)] = context
+
+            # Every page is captured at once, a few at a time so Chromium
+            # isn't rendering all the 2x full-page screenshots together
+            limit = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+            async def capture(page_config: PageSpec):
+                async with limit:
+                    context = contexts[(page_config.width, page_config.height)]
+                    await capture_page(context, page_config, output_dir)
+
+            await asyncio.gather(*(capture(page_config) for page_config in PAGES))
+        finally:
+            for context in contexts.values():
+                await context.close()
+
         await browser.close()
 
 def main():
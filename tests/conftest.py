@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration.
+
+Puts the project root on sys.path so tests can `from scripts import filter`
+(see scripts/__init__.py) however pytest is invoked.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
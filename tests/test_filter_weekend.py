@@ -1,38 +1,20 @@
 import re
-import importlib.util
 from datetime import datetime
-from pathlib import Path
 
 import pytest
-from pytz import UTC
 
-# Import scripts/filter.py as a module via its file path so tests
-# don't rely on the package name resolution.
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-FILTER_PATH = PROJECT_ROOT / "scripts" / "filter.py"
+from scripts import filter as filter_script
 
-spec = importlib.util.spec_from_file_location("filter_script", FILTER_PATH)
-assert spec and spec.loader, "Could not load scripts/filter.py"
-filter_script = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(filter_script)  # type: ignore[arg-type]
+RANGE_RE = re.compile(r"between (\S+)")
 
 
-def _run_with_fixed_now(now_iso: str):
+def _run_with_fixed_now(now_iso: str, capsys):
     """
     Helper to run filter_weekend_fixtures with a fixed 'today' value.
 
-    We monkeypatch scripts.filter.datetime.now so the weekend calculation
-    uses a deterministic reference point, then capture the printed range.
+    The reference time is passed straight to filter_weekend_fixtures so the
+    weekend calculation is deterministic, then the printed range is captured.
     """
-    class FixedDateTime(datetime):
-        @classmethod
-        def now(cls, tz=None):  # type: ignore[override]
-            base = datetime.fromisoformat(now_iso)
-            if tz is not None:
-                return base.astimezone(tz)
-            # default to UTC if no tz provided
-            return base.replace(tzinfo=UTC)
-
     # Craft a single dummy fixture so the function runs its loop
     fixtures = [
         {
@@ -51,25 +33,10 @@ def _run_with_fixed_now(now_iso: str):
         }
     ]
 
-    original_datetime = filter_script.datetime
-    try:
-        # Patch the datetime class used in the module
-        filter_script.datetime = FixedDateTime  # type: ignore[assignment]
-        # Capture the printed range line
-        captured = []
-
-        def fake_print(msg):
-            captured.append(str(msg))
-
-        # run, with print monkeypatched
-        filter_script.print = fake_print  # type: ignore[assignment]
-        filter_script.filter_weekend_fixtures(fixtures)
-    finally:
-        filter_script.datetime = original_datetime  # type: ignore[assignment]
-        # best effort: restore print; not critical in tests, but polite
+    filter_script.filter_weekend_fixtures(fixtures, now=datetime.fromisoformat(now_iso))
 
     # Find the "Filtering for fixtures between ..." line
-    for line in captured:
+    for line in capsys.readouterr().out.splitlines():
         if "Filtering for fixtures between" in line:
             return line
     raise AssertionError("Did not capture weekend range log line")
@@ -86,17 +53,17 @@ def _run_with_fixed_now(now_iso: str):
         ("2025-12-02T10:00:00+00:00", "2025-12-05"),
     ],
 )
-def test_filter_weekend_uses_current_weekend(today_iso, expected_range_start_date):
+def test_filter_weekend_uses_current_weekend(today_iso, expected_range_start_date, capsys):
     """
     Ensure that the weekend range anchor behaves as expected:
     - Saturday: same-day Saturday
     - Sunday: previous-day Saturday (current weekend)
     - Weekday: upcoming Saturday
     """
-    log_line = _run_with_fixed_now(today_iso)
+    log_line = _run_with_fixed_now(today_iso, capsys)
 
     # Extract the first datetime from the log line
-    m = re.search(r"between ([^ ]+)", log_line)
+    m = RANGE_RE.search(log_line)
     assert m, f"Could not parse range from: {log_line}"
     start_str = m.group(1)
 
@@ -108,3 +75,28 @@ def test_filter_weekend_uses_current_weekend(today_iso, expected_range_start_dat
     )
 
 
+
+
+@pytest.mark.parametrize(
+    "team, expected",
+    [("Men's 2s", 2), ("St Albans 1 (U14)", 114), ("Ladies", float("inf"))],
+)
+def test_get_team_number_joins_all_digits(team, expected):
+    assert filter_script.get_team_number({"team": team}) == expected
+
+
+def test_build_outputs_keeps_csv_and_json_category_rules():
+    fixture = {
+        "date": "2025-01-11T12:00:00", "team": "U14 Girls", "competition": "Girls U14",
+        "division": "U14", "home_team": "St Albans", "away_team": "Harpenden",
+        "kickoff": "12:00", "ha": "h", "competitionId": "c1",
+        "status": "Scheduled", "fixtureId": "1",
+    }
+
+    outputs = filter_script.build_outputs([fixture])
+
+    # The CSV split only looks for "women"/"men" (then the team prefix), while
+    # the JSON category also knows girls' competitions.
+    assert [row[0] for row in outputs["mens"]] == ["U14 Girls"]
+    assert outputs["womens"] == []
+    assert outputs["home"][0]["category"] == "women"
@@ -0,0 +1,471 @@
+import json
+
+import pytest
+
+from scripts import gms_fetcher as gms
+
+TEAM_ID = "ABC-123"
+
+
+LEAGUE_HTML = f"""
+<div class="gms-league">
+  <table class="gms-table">
+    <tbody>
+      <tr class="gms-clubteam" data-team="other-team">
+        <td>1</td><td>Other 1</td><td>5</td><td>5</td><td>0</td><td>0</td>
+        <td>20</td><td>2</td><td>18</td><td>15</td>
+      </tr>
+      <tr class="gms-row gms-clubteam" data-team="{TEAM_ID.lower()}">
+        <td> 3 </td><td><a href="/t">St Albans 1</a></td><td>5</td><td>3</td><td>1</td><td>1</td>
+        <td>12</td><td>6</td><td>6</td><td>10</td>
+      </tr>
+    </tbody>
+  </table>
+  <p class="gms-footnote"> Division 1 South (2025-2026) </p>
+</div>
+"""
+
+
+FIXTURES_HTML = """
+<table class="gms-table gms-table-results">
+  <thead><tr><th>Date</th></tr></thead>
+  <tbody>
+    <tr>
+      <td>15 Nov 2025</td><td>12:00</td><td>St Albans 1</td>
+      <td class="gms-score gms-win">3 - 1</td><td>Opponents 1</td>
+      <td><a href="https://maps.example/venue">Home Ground &amp; Pitch</a></td>
+    </tr>
+    <tr>
+      <td>22 Nov 2025</td><td>TBC</td><td>Opponents 2</td>
+      <td class="gms-score"></td><td>St Albans 1</td><td>Away Ground</td>
+    </tr>
+    <tr></tr>
+  </tbody>
+</table>
+<table class="gms-table-other"><tbody><tr><td>ignored</td></tr></tbody></table>
+"""
+
+
+SUMMARY_HTML = f"""
+<table class="gms-table">
+  <tbody>
+    <tr data-team="other-team"><td>Other 1</td><td>5</td><td>5</td><td>0</td><td>0</td>
+      <td>20</td><td>2</td><td>18</td><td>15</td><td>3.00</td><td></td></tr>
+    <tr data-team="{TEAM_ID}"><td>St Albans 1</td><td>5</td><td>3</td><td>1</td><td>1</td>
+      <td>12</td><td>6</td><td>6</td><td>10</td><td>2.00</td>
+      <td><span class="gms-form gms-form-w">W</span><span class="gms-form">L</span></td></tr>
+  </tbody>
+</table>
+"""
+
+
+COMPETITIONS_HTML = """
+<select name="comp_id" class="gms-select">
+  <option value="">Select a competition</option>
+  <option value=" comp-1 ">East Open - Men&#39;s Division 1</option>
+  <option value="comp-2" selected>East Women&#39;s Division 2 &amp; Cup</option>
+</select>
+"""
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so rate limiting runs instantly."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeSession:
+    """Serves one 200 with an ETag, then 304 whenever that ETag is sent back."""
+
+    def __init__(self):
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, b'{"html": "<p>hi</p>"}', {"ETag": '"v1"'})
+
+
+class ThrottledSession:
+    """Answers 429 (no Retry-After) until `throttled` requests have been made."""
+
+    def __init__(self, throttled):
+        self.throttled = throttled
+        self.calls = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls += 1
+        if self.calls <= self.throttled:
+            return FakeResponse(429)
+        return FakeResponse(200, b"{}")
+
+
+class FakeSummaryClient:
+    def get_team_summary(self, team_id):
+        if team_id == "boom":
+            raise RuntimeError("offline")
+        return {"teamName": f"Team {team_id}", "ppg": "1.0"}
+
+
+class FakeCompetitionClient:
+    def get_competitions_for_team(self, team_id):
+        return [{"compId": f"{team_id}-comp", "label": "League", "selected": True}]
+
+
+class CountingFixturesClient:
+    def __init__(self):
+        self.calls = []
+
+    def get_results_and_fixtures(self, team_id, comp_id):
+        self.calls.append((team_id, comp_id))
+        return []
+
+
+@pytest.fixture
+def htmlparser_only(monkeypatch):
+    """Force the HTMLParser fallback even when lxml is installed."""
+    monkeypatch.setattr(gms, "lxml_html", None)
+
+
+def test_parse_league_table_reads_target_row():
+    row = gms.parse_league_table(LEAGUE_HTML, TEAM_ID)
+    assert row is not None
+    assert row["position"] == "3"
+    assert row["teamName"] == "St Albans 1"
+    assert row["points"] == "10"
+    assert row["leagueName"] == "Division 1 South (2025-2026)"
+
+
+def test_parse_team_summary_reads_target_row():
+    summary = gms.parse_team_summary(SUMMARY_HTML, TEAM_ID)
+    assert summary is not None
+    assert summary["teamName"] == "St Albans 1"
+    assert summary["ppg"] == "2.00"
+    assert summary["form"] == [{"result": "W"}, {"result": "L"}]
+    assert gms.parse_team_summary(SUMMARY_HTML, "nobody") is None
+
+
+def test_parse_team_summary_matches_htmlparser(monkeypatch):
+    fast = gms.parse_team_summary(SUMMARY_HTML, TEAM_ID)
+    monkeypatch.setattr(gms, "lxml_html", None)
+    assert gms.parse_team_summary(SUMMARY_HTML, TEAM_ID) == fast
+
+
+@pytest.mark.parametrize("use_lxml", [True, False], ids=["lxml", "htmlparser"])
+def test_team_summary_stops_at_first_team_row(monkeypatch, use_lxml):
+    if not use_lxml:
+        monkeypatch.setattr(gms, "lxml_html", None)
+    html = SUMMARY_HTML + SUMMARY_HTML.replace("St Albans 1", "Duplicate")
+    cells, form = gms._extract_team_summary(html, TEAM_ID)
+    assert cells[0] == "St Albans 1"
+    assert form == [{"result": "W"}, {"result": "L"}]
+
+
+def test_narrow_league_html_keeps_row_and_footnote():
+    narrowed = gms.narrow_league_html(LEAGUE_HTML, TEAM_ID)
+    assert narrowed is not None
+    assert "other-team" not in narrowed
+    assert "gms-footnote" in narrowed
+    assert gms.narrow_league_html(LEAGUE_HTML, "nobody") is None
+
+
+def test_parse_league_table_missing_team():
+    assert gms.parse_league_table(LEAGUE_HTML, "nobody") is None
+    assert gms.parse_league_table("", TEAM_ID) is None
+
+
+def test_parse_league_table_matches_htmlparser(monkeypatch):
+    fast = gms.parse_league_table(LEAGUE_HTML, TEAM_ID)
+    monkeypatch.setattr(gms, "lxml_html", None)
+    assert gms.parse_league_table(LEAGUE_HTML, TEAM_ID) == fast
+
+
+def test_parse_results_and_fixtures_statuses():
+    fixtures = gms.parse_results_and_fixtures(FIXTURES_HTML)
+    assert len(fixtures) == 2
+
+    played, pending = fixtures
+    assert played["venue"] == "Home Ground & Pitch"
+    assert played["venueLink"] == "https://maps.example/venue"
+    assert played["dateIso"] == "2025-11-15"
+    assert played["dateTime"] == "2025-11-15T12:00:00"
+    assert played["status"] == "win"
+    assert played["completed"] is True
+
+    assert pending["venueLink"] is None
+    assert pending["dateTime"] is None
+    assert pending["status"] == "pending"
+    assert pending["completed"] is False
+
+
+def test_parse_results_and_fixtures_matches_htmlparser(monkeypatch):
+    fast = gms.parse_results_and_fixtures(FIXTURES_HTML)
+    monkeypatch.setattr(gms, "lxml_html", None)
+    assert gms.parse_results_and_fixtures(FIXTURES_HTML) == fast
+
+
+def test_htmlparser_fallback_handles_empty_input(htmlparser_only):
+    assert gms.parse_results_and_fixtures("") == []
+    assert gms.parse_league_table("", TEAM_ID) is None
+
+
+@pytest.mark.parametrize(
+    "score, expected",
+    [("3 - 1", (3, 1)), ("2:2", (2, 2)), (" 4 : 0 ", (4, 0)), ("3-1", (None, None)), ("", (None, None))],
+)
+def test_format_scoreboard_fixture_parses_scores(score, expected):
+    fixture = {"homeTeam": "St Albans 1", "awayTeam": "Opponents 1", "score": score}
+    formatted = gms.format_scoreboard_fixture(
+        fixture, "St Albans 1 (M)", "men", "East Open - Men's Division 1 South (2025-2026)", "id"
+    )
+    assert (formatted["home_score"], formatted["away_score"]) == expected
+    assert formatted["division"] == "Division 1 South"
+    assert formatted["location"] == "Home"
+
+
+def test_rate_limiter_allows_burst_then_spaces_requests(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(gms.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(gms.time, "sleep", clock.sleep)
+
+    client = gms.GMSClient(rate_limit_ms=1000, burst=2)
+    for _ in range(4):
+        client._respect_rate_limit()
+    assert clock.sleeps == [1.0, 1.0]
+
+    # A 429 backoff blocks everyone for the full delay
+    client._schedule_next_window(5000)
+    client._respect_rate_limit()
+    assert clock.sleeps[-1] == 5.0
+
+
+def test_default_client_spaces_first_two_requests(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(gms.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(gms.time, "sleep", clock.sleep)
+
+    client = gms.GMSClient()
+    client._respect_rate_limit()
+    client._respect_rate_limit()
+    assert clock.sleeps == [client.rate_limit_ms / 1000]
+
+
+def test_get_backs_off_with_jitter_after_429(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(gms.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(gms.time, "sleep", clock.sleep)
+    monkeypatch.setattr(gms.random, "uniform", lambda low, high: high)
+
+    session = ThrottledSession(throttled=2)
+    client = gms.GMSClient(rate_limit_ms=1000, session=session, cache=None)
+    assert client._get("https://example.test/a").status_code == 200
+    assert session.calls == 3
+    # 1s * 2**attempt, scaled by the (patched) maximum jitter of 1.5
+    assert clock.sleeps == [3.0, 6.0]
+
+
+def test_build_session_retries_gateway_errors_but_not_429():
+    retries = gms.build_session().get_adapter("https://gmsfeed.co.uk").max_retries
+    assert retries.total == gms.HTTP_TRANSIENT_RETRIES
+    assert 503 in retries.status_forcelist
+    assert 429 not in retries.status_forcelist
+
+
+def test_get_json_revalidates_cached_response(tmp_path):
+    session = FakeSession()
+    client = gms.GMSClient(
+        rate_limit_ms=0,
+        session=session,
+        cache=gms.ResponseCache(tmp_path / "cache.sqlite"),
+    )
+
+    assert client._get_json("https://example.test/a") == {"html": "<p>hi</p>"}
+    assert client._get_json("https://example.test/a") == {"html": "<p>hi</p>"}
+    assert session.sent_headers == [None, {"If-None-Match": '"v1"'}]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_fetch_team_records_serial_and_pooled_agree(workers):
+    entries = [
+        {"name": "A", "teamId": "a", "compId": "c"},
+        {"name": "B", "teamId": "boom", "compId": "c"},
+        {"name": "C", "teamId": "c"},
+    ]
+    jobs = [(gms.make_entry_key(e, i), e, i) for i, e in enumerate(entries, start=1)]
+    outcomes = gms.fetch_team_records(FakeSummaryClient(), jobs, workers)
+    assert [outcomes[key][0] for key, _, _ in jobs] == [True, False, False]
+    assert outcomes["a::c"][1]["teamDisplay"] == "Team a"
+    assert outcomes["boom::c"][1] == "B: offline"
+    assert gms.fetch_team_records(FakeSummaryClient(), [], workers) == {}
+
+
+def test_command_competitions_keeps_team_file_order(tmp_path):
+    team_file = tmp_path / "teamIDs.json"
+    team_file.write_text(
+        json.dumps([{"name": "A", "teamId": "a"}, {"name": "B"}, {"teamId": "c"}]),
+        encoding="utf-8",
+    )
+    output = tmp_path / "teamCompIDs.json"
+
+    gms.command_competitions(team_file, output, workers=4, client=FakeCompetitionClient())
+
+    saved = json.loads(output.read_text(encoding="utf-8"))
+    assert [record.get("compId") for record in saved] == ["a-comp", None, "c-comp"]
+    assert saved[1] == {"name": "B", "error": "Missing teamId"}
+    assert saved[2]["name"] == "Team 3"
+
+
+def test_command_update_scoreboard_fetches_shared_pairs_once(tmp_path):
+    team_file = tmp_path / "teamCompIDs.json"
+    team_file.write_text(
+        json.dumps(
+            [
+                {"name": "St Albans 1 (M)", "teamId": "a", "compId": "x"},
+                {"name": "St Albans 1 (M) again", "teamId": "a", "compId": "x"},
+                {"name": "St Albans 2 (M)", "teamId": "b", "compId": "x"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    client = CountingFixturesClient()
+
+    gms.command_update_scoreboard(team_file, tmp_path, "2025-10-04", client=client, workers=1)
+
+    assert client.calls == [("a", "x"), ("b", "x")]
+
+
+def test_command_update_scoreboard_keeps_unchanged_outputs(tmp_path, capsys):
+    team_file = tmp_path / "teamCompIDs.json"
+    team_file.write_text(
+        json.dumps([{"name": "St Albans 1 (M)", "teamId": "a", "compId": "x"}]), encoding="utf-8"
+    )
+    gms.command_update_scoreboard(team_file, tmp_path, "2025-10-04", client=CountingFixturesClient())
+    first = (tmp_path / "weekend_fixtures.json").read_bytes()
+    capsys.readouterr()
+
+    gms.command_update_scoreboard(team_file, tmp_path, "2025-10-04", client=CountingFixturesClient())
+
+    out = capsys.readouterr().out
+    assert "Wrote" not in out
+    assert out.count("kept") == 3
+    assert (tmp_path / "weekend_fixtures.json").read_bytes() == first
+
+
+def test_copy_record_with_meta_detaches_meta_only():
+    record = {"teamId": "a", "stats": {"ppg": "1.5"}, "meta": {"snapshotDate": "2025-11-15"}}
+    copied = gms.copy_record_with_meta(record)
+    copied["meta"]["source"] = "fallback"
+    assert record["meta"] == {"snapshotDate": "2025-11-15"}
+    assert copied["stats"] is record["stats"]
+    assert list(gms.copy_record_with_meta({"teamId": "b"})) == ["teamId", "meta"]
+
+
+def test_analyze_snapshot_buckets_records():
+    records = [
+        {"teamId": "a", "stats": {"ppg": "2.0"}},
+        {"teamId": "b", "error": "boom"},
+        {"teamId": "c", "stats": {"ppg": ""}},
+        {"name": "no id", "stats": None},
+    ]
+    stats = gms.analyze_snapshot(records)
+    assert stats["count"] == 4
+    assert stats["team_ids"] == {"a", "b", "c"}
+    assert [r["teamId"] for r in stats["errors"]] == ["b"]
+    assert [r.get("teamId") for r in stats["missing_ppg"]] == ["c", None]
+
+
+def test_load_fallback_map_indexes_by_team(tmp_path):
+    snapshot = tmp_path / "teamData.json"
+    snapshot.write_text(
+        json.dumps([{"teamId": "a", "v": 1}, {"name": "no id"}, {"teamId": "a", "v": 2}]),
+        encoding="utf-8",
+    )
+    assert gms.load_fallback_map(snapshot) == {"a": {"teamId": "a", "v": 2}}
+    assert gms.load_fallback_map(tmp_path / "missing.json") == {}
+
+
+def test_load_fallback_map_reloads_when_snapshot_changes(tmp_path):
+    snapshot = tmp_path / "teamData.json"
+    snapshot.write_text(json.dumps([{"teamId": "a"}]), encoding="utf-8")
+    first = gms.load_fallback_map(snapshot)
+    assert gms.load_fallback_map(snapshot) is first
+    with pytest.raises(TypeError):
+        first["b"] = {}
+
+    snapshot.write_text(json.dumps([{"teamId": "a"}, {"teamId": "b"}]), encoding="utf-8")
+    assert set(gms.load_fallback_map(snapshot)) == {"a", "b"}
+
+
+@pytest.mark.parametrize(
+    "html",
+    [COMPETITIONS_HTML, COMPETITIONS_HTML.replace('value="comp-2"', "value='comp-2'")],
+    ids=["regex", "htmlparser-fallback"],
+)
+def test_parse_competitions(html):
+    assert gms.parse_competitions(html) == [
+        {"compId": "comp-1", "label": "East Open - Men's Division 1", "selected": False},
+        {"compId": "comp-2", "label": "East Women's Division 2 & Cup", "selected": True},
+    ]
+
+
+@pytest.mark.parametrize(
+    "value_attr", ['value=" comp-1 "', "value=' comp-1 '"], ids=["regex", "htmlparser-fallback"]
+)
+def test_parse_competitions_ignores_selected_lookalikes(value_attr):
+    html = COMPETITIONS_HTML.replace(
+        'value=" comp-1 "', f'{value_attr} class="gms-option selected" data-selected="true"'
+    )
+    assert [option["selected"] for option in gms.parse_competitions(html)] == [False, True]
+
+
+def test_rotate_snapshots_first_run_has_nothing_to_archive(tmp_path):
+    new, current, previous = (tmp_path / name for name in ("new.json", "cur.json", "prev.json"))
+    new.write_text("[]", encoding="utf-8")
+    gms.rotate_snapshots(new, current, previous)
+    assert current.read_text(encoding="utf-8") == "[]"
+    assert not previous.exists()
+    with pytest.raises(FileNotFoundError):
+        gms.read_snapshot(tmp_path / "missing.json")
+
+
+def test_save_json_replaces_file_atomically(tmp_path):
+    target = tmp_path / "league" / "teamData.json"
+    gms.save_json([{"teamId": "a"}], target)
+    gms.save_json([{"teamId": "b"}], target)
+    assert json.loads(target.read_text(encoding="utf-8")) == [{"teamId": "b"}]
+    assert [p.name for p in target.parent.iterdir()] == ["teamData.json"]
+
+
+def test_print_json_pretty_prints(capsys):
+    gms.print_json({"team": "St Albans 1", "form": [{"result": "W"}]})
+    print("after")
+    out = capsys.readouterr().out
+    assert json.loads(out[: out.rindex("after")]) == {
+        "team": "St Albans 1",
+        "form": [{"result": "W"}],
+    }
+    assert out.endswith("}\nafter\n")
@@ -0,0 +1,72 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# Import scripts/live_league_updater.py via its file path, like the other tests.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+UPDATER_PATH = PROJECT_ROOT / "scripts" / "live_league_updater.py"
+
+spec = importlib.util.spec_from_file_location("live_league_updater_script", UPDATER_PATH)
+assert spec and spec.loader, "Could not load scripts/live_league_updater.py"
+updater = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(updater)  # type: ignore[arg-type]
+
+
+def test_run_fetch_calls_fetcher_in_process(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        updater.gms_fetcher,
+        "command_bulk_team_data",
+        lambda *args, **kwargs: calls.append(("bulk", args, kwargs)),
+    )
+    monkeypatch.setattr(
+        updater.gms_fetcher,
+        "command_validate_snapshots",
+        lambda *args: calls.append(("validate", args)),
+    )
+
+    assert updater.run_fetch(validate=True, expect_count=26)
+
+    bulk, validate = calls
+    assert bulk[1] == (updater.DEFAULT_CONFIG, updater.DEFAULT_OUTPUT)
+    assert bulk[2]["rotate"] is True
+    assert validate == ("validate", (updater.DEFAULT_OUTPUT, updater.DEFAULT_PREVIOUS, 26))
+
+
+def test_run_fetch_reports_failed_validation(monkeypatch):
+    def fail_validation(*args):
+        raise SystemExit(1)
+
+    monkeypatch.setattr(updater.gms_fetcher, "command_bulk_team_data", lambda *args, **kwargs: None)
+    monkeypatch.setattr(updater.gms_fetcher, "command_validate_snapshots", fail_validation)
+
+    assert updater.run_fetch(validate=True) is False
+
+
+def test_run_continuous_backs_off_after_failures(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+    outcomes = iter([False, False, True, True])
+
+    def fake_fetch(**kwargs):
+        clock[0] += 30
+        return next(outcomes)
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+        if len(sleeps) == 4:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(updater, "run_fetch", fake_fetch)
+    monkeypatch.setattr(updater.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(updater.time, "sleep", fake_sleep)
+    monkeypatch.setattr(updater.random, "uniform", lambda low, high: 0)
+
+    with pytest.raises(SystemExit):
+        updater.run_continuous(interval_minutes=5, validate=False, expect_count=None)
+
+    # 20s then 40s retries, then back on the 5-minute cycle measured from
+    # the start of each fetch
+    assert sleeps == [20, 40, 270, 270]